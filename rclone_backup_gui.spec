@@ -30,6 +30,9 @@ for pkg in ['pystray']:
     binaries += b
     hiddenimports += h
 
+# Bundled assets (pre-rendered tray icon)
+datas += [('src/utils/assets', 'src/utils/assets')]
+
 # Additional hidden imports
 hiddenimports += [
     # ttkbootstrap essentials
@@ -21,7 +21,7 @@ if command -v python3 &> /dev/null; then
     PYTHON_VERSION=$(python3 --version | cut -d' ' -f2)
     echo -e "${GREEN}✓${NC} Python $PYTHON_VERSION found"
 else
-    echo -e "${RED}✗${NC} Python 3 not found. Please install Python 3.7 or higher."
+    echo -e "${RED}✗${NC} Python 3 not found. Please install Python 3.9 or higher."
     exit 1
 fi
 
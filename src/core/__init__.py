@@ -3,7 +3,8 @@
 
 from .backup_manager import BackupManager
 from .config_manager import load_config, save_config, get_default_config
-from .rclone_runner import run_rclone_copy
+from .log_classifier import classify_log_line
+from .rclone_runner import RCLONE_PATH, run_rclone_copy, list_remotes
 from .state_manager import StateManager
 
 __all__ = [
@@ -11,6 +12,9 @@ __all__ = [
     'load_config',
     'save_config', 
     'get_default_config',
+    'classify_log_line',
+    'RCLONE_PATH',
     'run_rclone_copy',
+    'list_remotes',
     'StateManager'
 ]
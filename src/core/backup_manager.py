@@ -1,17 +1,35 @@
 # Backup Manager | Python
 """Core backup operations manager."""
 
+import os
 import threading
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Callable, Optional
+from types import MappingProxyType
+from typing import Dict, List, Callable, Mapping, Optional, Tuple
 
 from ..utils.constants import FIRST_RUN_FLAG, logger
 from .config_manager import load_config
+from .log_classifier import classify_log_line
 from .rclone_runner import run_rclone_copy
 from .state_manager import StateManager
 
 
+def _resolve_remote(local: str, remote: str) -> str:
+    """Append the source folder's name to a remote path that is a single folder deep.
+    
+    Args:
+        local: Source path being backed up
+        remote: Destination as remotename:path
+    
+    Returns:
+        'remote:folder/<source name>' for single-folder paths, otherwise remote unchanged
+    """
+    _, sep, remote_path = remote.partition(':')
+    if sep and remote_path and '/' not in remote_path:
+        return f"{remote.rstrip('/')}/{os.path.basename(os.path.normpath(local))}"
+    return remote
+
+
 class BackupManager:
     """Manages backup operations, status tracking, and scheduling."""
 
@@ -21,19 +39,34 @@ class BackupManager:
         self.threads: Dict[str, threading.Thread] = {}
         self.status: Dict[str, Dict] = {}
         self.logs: Dict[str, List[str]] = {}
+        self.log_tags: Dict[str, List[Optional[str]]] = {}
         self.lock = threading.Lock()
         self.stop_requested = False
         self._on_complete_callbacks: List[Callable] = []
+        self._all_done_event = threading.Event()
+        self._status_snapshot: Optional[Mapping[str, Mapping]] = None
+        self._log_generation = 0
+        self._names_cache: Optional[Tuple[Dict, Tuple[str, ...]]] = None
+        self._all_done_event.set()
 
     def reload_config(self):
         """Reload configuration from file."""
         self.config = load_config()
+        self._names_cache = None
         logger.info("Configuration reloaded")
 
     def get_backup_sets(self) -> List[Dict]:
         """Get all configured backup sets."""
         return self.config.get('backup_sets', [])
 
+    def get_backup_set_names(self) -> Tuple[str, ...]:
+        """Get the names of all configured backup sets, cached per loaded config."""
+        config = self.config
+        if self._names_cache is None or self._names_cache[0] is not config:
+            names = tuple(s.get('name') for s in config.get('backup_sets', []))
+            self._names_cache = (config, names)
+        return self._names_cache[1]
+
     def get_settings(self) -> Dict:
         """Get rclone settings."""
         return self.config.get('settings', {})
@@ -70,6 +103,13 @@ class BackupManager:
             extras.append('--dry-run')
             logger.info("Dry run mode enabled")
 
+        # Shared read-only by every backup thread in this batch
+        extras = tuple(extras)
+
+        self._all_done_event.clear()
+        pending = []
+        self._log_generation += 1
+
         for backup_set in self.get_backup_sets():
             name = backup_set.get('name', 'unnamed')
             local = backup_set.get('local', '')
@@ -81,6 +121,7 @@ class BackupManager:
 
             # Initialize status
             with self.lock:
+                self._status_snapshot = None
                 self.status[name] = {
                     'percent': 0,
                     'line': 'Initializing...',
@@ -88,6 +129,7 @@ class BackupManager:
                     'start_time': datetime.now().isoformat()
                 }
                 self.logs[name] = []
+                self.log_tags[name] = []
 
             thread = threading.Thread(
                 target=self._run_backup,
@@ -95,13 +137,19 @@ class BackupManager:
                 daemon=True
             )
             self.threads[name] = thread
+            pending.append(thread)
+
+        # Start only once every status exists so completion checks see the whole batch
+        for thread in pending:
             thread.start()
+        if not pending:
+            self._all_done_event.set()
 
         # Mark first run complete
         if first_run and self.get_backup_sets():
             FIRST_RUN_FLAG.write_text(datetime.utcnow().isoformat())
 
-    def _run_backup(self, name: str, local: str, remote: str, extras: List[str]):
+    def _run_backup(self, name: str, local: str, remote: str, extras: Tuple[str, ...]):
         """Execute a single backup operation."""
         start_time = datetime.now()
 
@@ -111,8 +159,11 @@ class BackupManager:
                 self.status[name]['line'] = line
 
         def log_cb(line: str):
+            # Classified once here so viewers never re-scan old lines
+            tag = classify_log_line(line)
             with self.lock:
                 self.logs[name].append(line)
+                self.log_tags[name].append(tag)
 
         # Log header
         log_cb(f"{'='*60}\n")
@@ -124,9 +175,7 @@ class BackupManager:
 
         # Adjust remote path if needed
         try:
-            remote_path = remote.split(':', 1)[1] if ':' in remote else ''
-            if remote_path and '/' not in remote_path:
-                remote = f"{remote.rstrip('/')}/{Path(local).name}"
+            remote = _resolve_remote(local, remote)
         except Exception:
             pass
 
@@ -139,6 +188,7 @@ class BackupManager:
 
         # Update status
         with self.lock:
+            self._status_snapshot = None
             self.status[name] = {
                 'percent': 100.0,
                 'line': 'Completed successfully' if rc == 0 else f'Failed (exit code: {rc})',
@@ -165,15 +215,84 @@ class BackupManager:
             except Exception as e:
                 logger.error(f"Callback error: {e}")
 
+        with self.lock:
+            if all(s.get('rc') is not None for s in self.status.values()):
+                self._all_done_event.set()
+
+    def wait_until_done(self, timeout: Optional[float] = None) -> bool:
+        """Block until every started backup has finished.
+
+        Returns:
+            True if all backups finished, False if the timeout expired
+        """
+        return self._all_done_event.wait(timeout)
+
+    def release_waiters(self):
+        """Wake any thread blocked in wait_until_done, e.g. on shutdown."""
+        self._all_done_event.set()
+
     def get_status(self) -> Dict:
         """Get current status of all backups."""
         with self.lock:
             return dict(self.status)
 
-    def get_logs(self, name: str) -> str:
-        """Get logs for a specific backup."""
+    def get_status_snapshot(self) -> Mapping[str, Mapping]:
+        """Get a read-only copy of all statuses, rebuilt only when a run starts or ends.
+
+        Suited to checks on exit codes; progress fields may be stale, so use
+        get_status() for live progress. The snapshot is shared between callers,
+        so it is returned as read-only views.
+        """
+        with self.lock:
+            if self._status_snapshot is None:
+                self._status_snapshot = MappingProxyType(
+                    {n: MappingProxyType(dict(s)) for n, s in self.status.items()}
+                )
+            return self._status_snapshot
+
+    def get_logs(self, name: str, start: int = 0, end: Optional[int] = None,
+                 tail_bytes: Optional[int] = None) -> str:
+        """Get logs for a specific backup.
+        
+        Args:
+            name: Backup set name
+            start: Index of the first log line to include
+            end: Index after the last log line to include, or None for all
+            tail_bytes: If set, keep only the whole trailing lines that fit in this many characters
+        
+        Returns:
+            The selected log lines joined into one string
+        """
+        return ''.join(text for _, text in self.get_logs_tagged(name, start, end, tail_bytes))
+
+    def get_logs_tagged(self, name: str, start: int = 0, end: Optional[int] = None,
+                        tail_bytes: Optional[int] = None) -> List[Tuple[Optional[str], str]]:
+        """Get log lines paired with the highlight tag assigned when they were logged.
+        
+        Takes the same arguments as get_logs().
+        
+        Returns:
+            A list of (tag, line) pairs; tag is None for plain lines
+        """
         with self.lock:
-            return ''.join(self.logs.get(name, []))
+            lines = self.logs.get(name, [])[start:end]
+            tags = self.log_tags.get(name, [])[start:end]
+        
+        if tail_bytes is not None:
+            size = 0
+            cut = len(lines)
+            # Always keep the last line, however long
+            while cut and (cut == len(lines) or size + len(lines[cut - 1]) <= tail_bytes):
+                cut -= 1
+                size += len(lines[cut])
+            del lines[:cut]
+            del tags[:cut]
+        return list(zip(tags, lines))
+
+    def get_log_stamp(self, name: str) -> Tuple[int, int]:
+        """Get a cheap (run generation, line count) stamp that changes with the logs."""
+        with self.lock:
+            return self._log_generation, len(self.logs.get(name, ()))
 
     def get_last_run_time(self, name: str) -> str:
         """Get formatted last run time for a backup."""
@@ -199,3 +318,7 @@ class BackupManager:
     def get_statistics(self) -> Dict:
         """Get backup statistics."""
         return self.state.get_statistics()
+
+    def get_stats_version(self) -> int:
+        """Get a counter that changes whenever statistics change."""
+        return self.state.get_stats_version()
@@ -0,0 +1,24 @@
+# Log Classifier | Python
+"""Highlight classification for backup log lines."""
+
+import functools
+import re
+from typing import Optional
+
+# Highlight tags in priority order; the first matching pattern wins
+_LINE_PATTERNS = (
+    (re.compile(r'===|^Backup:|^Source:'), 'header'),
+    (re.compile(r'SUCCESS|Completed|exit code: 0'), 'success'),
+    (re.compile(r'FAILED|(?i:error)'), 'error'),
+    (re.compile(r'(?i:warning)'), 'warning'),
+    (re.compile(r'^\$|Transferring'), 'info'),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_log_line(line: str) -> Optional[str]:
+    """Get the highlight tag for a log line, or None for plain text."""
+    for pattern, tag in _LINE_PATTERNS:
+        if pattern.search(line):
+            return tag
+    return None
@@ -1,18 +1,65 @@
 # RClone Runner | Python
 """RClone command execution with progress tracking."""
 
+import functools
 import re
 import shlex
+import shutil
 import subprocess
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Sequence
 
-from ..utils.constants import IS_WINDOWS, logger
+from ..utils.constants import IS_WINDOWS, IS_LINUX, logger
+
+if IS_LINUX:
+    import fcntl
+
+# Larger stdout pipe so rclone doesn't block on writes while the reader lags
+_PIPE_SIZE = 1 << 20
+_F_SETPIPE_SZ = 1031
+
+# Resolved once at import so a missing binary is detected without forking; None if absent
+RCLONE_PATH = shutil.which('rclone')
+
+_RCLONE_NOT_FOUND = "rclone not found. Please install rclone and add to PATH."
+
+
+def _quote_args(args: Sequence[str]) -> str:
+    """Quote arguments for display in the platform's shell syntax."""
+    if IS_WINDOWS:
+        return subprocess.list2cmdline(args)
+    return ' '.join(shlex.quote(x) for x in args)
+
+
+# Every backup in a batch shares the same extras tuple, so its quoted form is reused
+_quote_extras = functools.lru_cache(maxsize=16)(_quote_args)
+
+
+def _enlarge_pipe(pipe):
+    """Grow a pipe's kernel buffer on Linux; silently keep the default otherwise."""
+    if not IS_LINUX or pipe is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), getattr(fcntl, 'F_SETPIPE_SZ', _F_SETPIPE_SZ), _PIPE_SIZE)
+    except OSError:
+        pass
+
+
+def _report_error(
+    error: str,
+    progress_callback: Optional[Callable[[float, str], None]],
+    log_callback: Optional[Callable[[str], None]]
+):
+    """Send an error message to the log and progress callbacks."""
+    if log_callback:
+        log_callback(f'ERROR: {error}\n')
+    if progress_callback:
+        progress_callback(0, error)
 
 
 def run_rclone_copy(
     local: str,
     remote: str,
-    extras: List[str],
+    extras: Sequence[str],
     progress_callback: Optional[Callable[[float, str], None]] = None,
     log_callback: Optional[Callable[[str], None]] = None
 ) -> int:
@@ -28,9 +75,17 @@ def run_rclone_copy(
     Returns:
         Exit code (0 = success)
     """
-    cmd = ['rclone', 'copy', local, remote, '--progress', '--stats=1s'] + extras
+    if RCLONE_PATH is None:
+        logger.error(_RCLONE_NOT_FOUND)
+        _report_error(_RCLONE_NOT_FOUND, progress_callback, log_callback)
+        return 127
+
+    extras = tuple(extras)
+    cmd = [RCLONE_PATH, 'copy', local, remote, '--progress', '--stats=1s', *extras]
 
-    cmd_str = subprocess.list2cmdline(cmd) if IS_WINDOWS else ' '.join(shlex.quote(x) for x in cmd)
+    cmd_str = _quote_args(cmd[:6])
+    if extras:
+        cmd_str = f'{cmd_str} {_quote_extras(extras)}'
     
     logger.info(f'Executing: {cmd_str}')
     if log_callback:
@@ -39,19 +94,24 @@ def run_rclone_copy(
     try:
         encoding = 'utf-8' if not IS_WINDOWS else 'cp437'
 
+        # Headless callers don't consume output, so don't pipe it at all
+        quiet = log_callback is None and progress_callback is None
+
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            executable=RCLONE_PATH,
+            stdout=subprocess.DEVNULL if quiet else subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
             encoding=encoding,
             errors='replace'
         )
+        _enlarge_pipe(process.stdout)
 
         percent = 0.0
         current_file = ""
         
-        for line in process.stdout:
+        for line in process.stdout or ():
             line = line.rstrip('\n')
             if log_callback:
                 log_callback(line + '\n')
@@ -80,42 +140,38 @@ def run_rclone_copy(
 
         rc = process.wait()
         
-        if progress_callback:
+        if progress_callback is not None:
             if rc == 0:
                 progress_callback(100.0, 'Completed successfully')
             else:
                 progress_callback(percent, f'Failed (exit code: {rc})')
         
-        if log_callback:
+        if log_callback is not None:
             status = "SUCCESS" if rc == 0 else "FAILED"
             log_callback(f'\n[{status}] Exit code: {rc}\n')
 
         return rc
 
     except FileNotFoundError:
-        error = "rclone not found. Please install rclone and add to PATH."
-        logger.error(error)
-        if log_callback:
-            log_callback(f'ERROR: {error}\n')
-        if progress_callback:
-            progress_callback(0, error)
+        logger.error(_RCLONE_NOT_FOUND)
+        _report_error(_RCLONE_NOT_FOUND, progress_callback, log_callback)
         return 127
 
     except Exception as e:
         error = f'Unexpected error: {e}'
         logger.exception(error)
-        if log_callback:
-            log_callback(f'ERROR: {error}\n')
-        if progress_callback:
-            progress_callback(0, error)
+        _report_error(error, progress_callback, log_callback)
         return 1
 
 
 def check_rclone_installed() -> tuple[bool, str]:
     """Check if rclone is installed and get version."""
+    if RCLONE_PATH is None:
+        return False, "rclone not installed"
+
     try:
         result = subprocess.run(
-            ['rclone', 'version'],
+            [RCLONE_PATH, 'version'],
             capture_output=True,
             text=True,
             timeout=5
@@ -132,9 +188,12 @@ def check_rclone_installed() -> tuple[bool, str]:
 
 def list_remotes() -> List[str]:
     """List configured rclone remotes."""
+    if RCLONE_PATH is None:
+        return []
+
     try:
         result = subprocess.run(
-            ['rclone', 'listremotes'],
+            [RCLONE_PATH, 'listremotes'],
             capture_output=True,
             text=True,
             timeout=10
@@ -1,11 +1,61 @@
 # State Manager | Python
 """Persistent state management for backup history and statistics."""
 
+import atexit
+import itertools
 import json
+import mmap
+import os
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from ..utils.constants import STATE_FILE, logger
+from ..utils.constants import STATE_FILE, HAS_ORJSON, logger
+
+if HAS_ORJSON:
+    import orjson
+
+# Seconds of quiet after the last change before state is written to disk
+FLUSH_DELAY = 2.0
+
+# Number of runs kept in the history
+HISTORY_LIMIT = 100
+
+# State files larger than this are mapped into memory instead of read
+MMAP_THRESHOLD = 64 * 1024
+
+# Display format for last run times
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Bound once to skip the attribute lookups on each call
+_now = datetime.now
+_fromiso = datetime.fromisoformat
+
+
+def _loads(data: bytes) -> Dict:
+    """Parse state JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_state_file() -> Dict:
+    """Read and parse the state file, mapping large files without copying."""
+    if not HAS_ORJSON or STATE_FILE.stat().st_size <= MMAP_THRESHOLD:
+        return _loads(STATE_FILE.read_bytes())
+
+    with STATE_FILE.open('rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _dumps(state: Dict) -> bytes:
+    """Serialize state as compact JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(',', ':')).encode('utf-8')
 
 
 class StateManager:
@@ -13,6 +63,11 @@ class StateManager:
 
     def __init__(self):
         self._state = self._load_state()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._stats_version = 0
+        atexit.register(self._flush)
 
     def _load_state(self) -> Dict:
         """Load state from file."""
@@ -20,8 +75,9 @@ class StateManager:
             return self._get_default_state()
 
         try:
-            with STATE_FILE.open('r', encoding='utf-8') as f:
-                return json.load(f)
+            state = _read_state_file()
+            state['run_history'] = deque(state.get('run_history', []), maxlen=HISTORY_LIMIT)
+            return state
         except Exception as e:
             logger.error(f"Failed to load state: {e}")
             return self._get_default_state()
@@ -30,7 +86,7 @@ class StateManager:
         """Return default state structure."""
         return {
             "last_runs": {},
-            "run_history": [],
+            "run_history": deque(maxlen=HISTORY_LIMIT),
             "statistics": {
                 "total_runs": 0,
                 "successful_runs": 0,
@@ -40,43 +96,77 @@ class StateManager:
 
     def save(self) -> bool:
         """Save state to file."""
+        tmp_file = STATE_FILE.with_suffix('.json.tmp')
         try:
             STATE_FILE.parent.mkdir(exist_ok=True)
-            with STATE_FILE.open('w', encoding='utf-8') as f:
-                json.dump(self._state, f, indent=2)
+            with self._lock:
+                state = {**self._state, 'run_history': list(self._state['run_history'])}
+                data = _dumps(state)
+            
+            # Write and sync a temp file, then swap it in so a crash never leaves partial JSON
+            with tmp_file.open('wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, STATE_FILE)
             return True
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
             return False
 
+    def _schedule_flush(self):
+        """Mark state dirty and (re)start the debounced flush timer."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(FLUSH_DELAY, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Write pending changes to disk, if any."""
+        with self._lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save()
+
     def record_run(self, name: str, success: bool, duration: float):
         """Record a backup run."""
-        timestamp = datetime.now().isoformat()
-        
-        # Update last run
-        self._state['last_runs'][name] = {
-            'timestamp': timestamp,
-            'success': success,
-            'duration': duration
-        }
-        
-        # Add to history (keep last 100)
-        self._state['run_history'].append({
-            'name': name,
-            'timestamp': timestamp,
-            'success': success,
-            'duration': duration
-        })
-        self._state['run_history'] = self._state['run_history'][-100:]
+        # Second precision keeps stored timestamps short and quick to parse
+        now = _now().replace(microsecond=0)
+        timestamp = now.isoformat()
         
-        # Update statistics
-        self._state['statistics']['total_runs'] += 1
-        if success:
-            self._state['statistics']['successful_runs'] += 1
-        else:
-            self._state['statistics']['failed_runs'] += 1
+        with self._lock:
+            # Update last run
+            self._state['last_runs'][name] = {
+                'timestamp': timestamp,
+                'formatted': now.strftime(TIME_FORMAT),
+                'success': success,
+                'duration': duration
+            }
+            
+            # Add to history (bounded deque drops the oldest)
+            self._state['run_history'].append({
+                'name': name,
+                'timestamp': timestamp,
+                'success': success,
+                'duration': duration
+            })
+            
+            # Update statistics
+            self._state['statistics']['total_runs'] += 1
+            if success:
+                self._state['statistics']['successful_runs'] += 1
+            else:
+                self._state['statistics']['failed_runs'] += 1
+            self._stats_version += 1
         
-        self.save()
+        self._schedule_flush()
 
     def get_last_run(self, name: str) -> Optional[Dict]:
         """Get last run info for a backup."""
@@ -88,9 +178,15 @@ class StateManager:
         if not last_run:
             return "Never"
         
+        formatted = last_run.get('formatted')
+        if formatted:
+            return formatted
+        
+        # Entries saved before 'formatted' existed are parsed once and memoized
         try:
-            dt = datetime.fromisoformat(last_run['timestamp'])
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
+            dt = _fromiso(last_run['timestamp'])
+            last_run['formatted'] = dt.strftime(TIME_FORMAT)
+            return last_run['formatted']
         except Exception:
             return "Unknown"
 
@@ -98,6 +194,10 @@ class StateManager:
         """Get backup statistics."""
         return self._state['statistics']
 
+    def get_stats_version(self) -> int:
+        """Get a counter that changes whenever statistics change."""
+        return self._stats_version
+
     def get_recent_history(self, limit: int = 10) -> List[Dict]:
         """Get recent backup history."""
-        return self._state['run_history'][-limit:][::-1]
+        return list(itertools.islice(reversed(self._state['run_history']), limit))
@@ -5,10 +5,11 @@ from .main_window import MainWindow
 from .backup_tab import BackupTab
 from .config_tab import ConfigTab
 from .logs_tab import LogsTab
+from .scheduler import RefreshScheduler
 from .components import (
-    create_tooltip, create_menu_bar, create_status_bar,
+    create_tooltip, create_lazy_tooltip, create_menu_bar, create_status_bar,
     show_about_dialog, show_documentation_dialog, show_shortcuts_dialog,
-    ModernCard, IconButton
+    prefetch_rclone_version, ModernCard, IconButton
 )
 from .theme import ThemeManager, ICONS
 
@@ -17,8 +18,10 @@ __all__ = [
     'BackupTab',
     'ConfigTab', 
     'LogsTab',
-    'create_tooltip', 'create_menu_bar', 'create_status_bar',
+    'RefreshScheduler',
+    'create_tooltip', 'create_lazy_tooltip', 'create_menu_bar', 'create_status_bar',
     'show_about_dialog', 'show_documentation_dialog', 'show_shortcuts_dialog',
+    'prefetch_rclone_version',
     'ModernCard', 'IconButton',
     'ThemeManager', 'ICONS'
 ]
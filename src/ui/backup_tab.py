@@ -1,16 +1,58 @@
 # Backup Tab | Python
 """Backup operations tab with modern UI."""
 
-import threading
-import time
 import tkinter as tk
-from typing import Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Callable
 
-from ..utils.constants import ttk, messagebox, HAS_TTK_BOOTSTRAP, COLORS, logger
+from ..utils.constants import ttk, messagebox, HAS_TTK_BOOTSTRAP, IS_LINUX, IS_MAC, COLORS, logger
 from ..core.backup_manager import BackupManager
 from .components import create_tooltip, ModernCard
+from .scheduler import RefreshScheduler
 from .theme import ICONS, get_status_color, get_font, SPACING
 
+# Status polling intervals
+STATUS_INTERVAL_RUNNING_MS = 1000
+STATUS_INTERVAL_IDLE_MS = 5000
+
+# Status label icon and color per backup state
+_STATUS_STYLE = {
+    'success': (ICONS.success, COLORS['success']),
+    'error': (ICONS.error, COLORS['danger']),
+    'running': (ICONS.loading, COLORS['primary']),
+    'idle': (ICONS.info, COLORS['muted']),
+}
+
+
+def _wheel_up(canvas: tk.Canvas, event):
+    """Scroll up one unit for an X11 Button-4 event."""
+    canvas.yview_scroll(-1, "units")
+
+
+def _wheel_down(canvas: tk.Canvas, event):
+    """Scroll down one unit for an X11 Button-5 event."""
+    canvas.yview_scroll(1, "units")
+
+
+def _wheel_delta(canvas: tk.Canvas, event):
+    """Scroll by a Windows wheel delta, which comes in multiples of 120."""
+    canvas.yview_scroll(int(-event.delta / 120), "units")
+
+
+def _wheel_delta_mac(canvas: tk.Canvas, event):
+    """Scroll by a macOS wheel delta, which is already in small steps."""
+    canvas.yview_scroll(-event.delta, "units")
+
+
+# Wheel events and their handlers for this platform, picked once at import
+if IS_LINUX:
+    _WHEEL_HANDLERS = (('<Button-4>', _wheel_up), ('<Button-5>', _wheel_down))
+elif IS_MAC:
+    _WHEEL_HANDLERS = (('<MouseWheel>', _wheel_delta_mac),)
+else:
+    _WHEEL_HANDLERS = (('<MouseWheel>', _wheel_delta),)
+
 
 class BackupTab:
     """Modern backup operations tab."""
@@ -20,15 +62,25 @@ class BackupTab:
         parent: ttk.Frame,
         manager: BackupManager,
         root: tk.Tk,
-        on_minimize: Optional[Callable] = None
+        on_minimize: Optional[Callable] = None,
+        scheduler: Optional[RefreshScheduler] = None
     ):
         self.parent = parent
         self.manager = manager
         self.root = root
         self.on_minimize = on_minimize
+        self.scheduler = scheduler or RefreshScheduler(root)
         self.backup_widgets: Dict[str, Dict] = {}
         self.status_bar: Optional[ttk.Label] = None
         self.auto_run_timer: Optional[str] = None
+        self._empty_frame: Optional[ttk.Frame] = None
+        self._card_pool: List[Dict] = []
+        self._canvas: Optional[tk.Canvas] = None
+        self._pending_cfg: Optional[str] = None
+        self._last_w = 0
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='backup-monitor')
+        self._closed = False
+        self._last_stats_version: Optional[int] = None
 
     def setup(self):
         """Initialize the backup tab UI."""
@@ -50,7 +102,7 @@ class BackupTab:
         
         ttk.Label(
             title_frame,
-            text=f"{ICONS['sync']} Backup Operations",
+            text=f"{ICONS.sync} Backup Operations",
             font=get_font(14, 'bold')
         ).pack(side=tk.LEFT)
         
@@ -62,7 +114,7 @@ class BackupTab:
             # Start All button
             start_btn = ttk.Button(
                 btn_frame,
-                text=f"{ICONS['play']} Start All",
+                text=f"{ICONS.play} Start All",
                 command=self._start_all,
                 bootstyle="success",
                 width=14
@@ -73,7 +125,7 @@ class BackupTab:
             # Run Once button
             run_once_btn = ttk.Button(
                 btn_frame,
-                text=f"{ICONS['bolt']} Run Once",
+                text=f"{ICONS.bolt} Run Once",
                 command=self._run_once,
                 bootstyle="info",
                 width=14
@@ -87,7 +139,7 @@ class BackupTab:
             # Minimize button
             minimize_btn = ttk.Button(
                 btn_frame,
-                text=f"{ICONS['minimize']} Minimize",
+                text=f"{ICONS.minimize} Minimize",
                 command=self._minimize_app,
                 bootstyle="secondary-outline",
                 width=12
@@ -116,6 +168,11 @@ class BackupTab:
 
     def _update_stats(self):
         """Update the statistics display."""
+        version = self.manager.get_stats_version()
+        if version == self._last_stats_version:
+            return
+        self._last_stats_version = version
+        
         stats = self.manager.get_statistics()
         total = stats.get('total_runs', 0)
         success = stats.get('successful_runs', 0)
@@ -124,14 +181,14 @@ class BackupTab:
         if total > 0:
             success_rate = (success / total) * 100
             self.stats_label.config(
-                text=f"{ICONS['info']} Total runs: {total} | Success: {success} | Failed: {failed} | Success rate: {success_rate:.0f}%"
+                text=f"{ICONS.info} Total runs: {total} | Success: {success} | Failed: {failed} | Success rate: {success_rate:.0f}%"
             )
         else:
-            self.stats_label.config(text=f"{ICONS['info']} No backup history yet")
+            self.stats_label.config(text=f"{ICONS.info} No backup history yet")
 
     def _create_backup_list(self):
         """Create the scrollable backup list."""
-        list_frame = ttk.Labelframe(self.parent, text=f"{ICONS['folder']} Backup Sets", padding=10)
+        list_frame = ttk.Labelframe(self.parent, text=f"{ICONS.folder} Backup Sets", padding=10)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         # Scrollable container
@@ -139,65 +196,150 @@ class BackupTab:
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
         self.backup_items_frame = ttk.Frame(canvas)
         
-        self.backup_items_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.backup_items_frame.bind("<Configure>", self._schedule_scrollregion_update)
         
         canvas_window = canvas.create_window((0, 0), window=self.backup_items_frame, anchor=tk.NW)
         
         # Make canvas expand to full width
         def configure_canvas(event):
-            canvas.itemconfig(canvas_window, width=event.width)
+            if event.width != self._last_w:
+                self._last_w = event.width
+                canvas.itemconfig(canvas_window, width=event.width)
         canvas.bind('<Configure>', configure_canvas)
+        self._canvas = canvas
         
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Mouse wheel scrolling
-        def on_mousewheel(event):
-            if event.num == 4:
-                canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                canvas.yview_scroll(1, "units")
-            else:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Mouse wheel scrolling with this platform's handlers
+        wheel_handlers = {sequence: partial(handler, canvas) for sequence, handler in _WHEEL_HANDLERS}
+        
+        # Route the wheel to this canvas only while the pointer is over the list
+        def bind_wheel(event):
+            for sequence, handler in wheel_handlers.items():
+                canvas.bind_all(sequence, handler)
         
-        canvas.bind_all('<Button-4>', on_mousewheel)
-        canvas.bind_all('<Button-5>', on_mousewheel)
-        canvas.bind_all('<MouseWheel>', on_mousewheel)
+        def unbind_wheel(event):
+            for sequence in wheel_handlers:
+                canvas.unbind_all(sequence)
+        
+        list_frame.bind('<Enter>', bind_wheel)
+        list_frame.bind('<Leave>', unbind_wheel)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+    def _schedule_scrollregion_update(self, event=None):
+        """Coalesce bursts of resize events into one scroll region update."""
+        if self._pending_cfg:
+            self.parent.after_cancel(self._pending_cfg)
+        self._pending_cfg = self.parent.after(30, self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Fit the scroll region to the backup cards."""
+        self._pending_cfg = None
+        self._canvas.configure(scrollregion=self._canvas.bbox("all"))
+
     def _refresh_backup_list(self):
-        """Refresh the backup list display."""
-        # Clear existing
-        for widget in self.backup_items_frame.winfo_children():
-            widget.destroy()
-        self.backup_widgets.clear()
-        
+        """Refresh the backup list display, rebuilding only changed cards."""
         backup_sets = self.manager.get_backup_sets()
+        new_names = list(dict.fromkeys(s.get('name', 'unnamed') for s in backup_sets))
+        
+        # Hide cards for sets that no longer exist and keep them for reuse
+        for name in set(self.backup_widgets) - set(new_names):
+            widgets = self.backup_widgets.pop(name)
+            widgets['card'].pack_forget()
+            self._card_pool.append(widgets)
         
         if not backup_sets:
-            empty_frame = ttk.Frame(self.backup_items_frame)
-            empty_frame.pack(fill=tk.X, pady=40)
-            
-            ttk.Label(
-                empty_frame,
-                text=f"{ICONS['folder']} No backup sets configured",
-                font=get_font(11),
-                foreground=COLORS['muted']
-            ).pack()
-            
-            ttk.Label(
-                empty_frame,
-                text="Go to Configuration tab to add backup sets",
-                foreground=COLORS['muted']
-            ).pack(pady=(5, 0))
+            self._show_empty_state()
             return
+        self._hide_empty_state()
         
         for backup_set in backup_sets:
-            self._create_backup_card(backup_set)
+            widgets = self.backup_widgets.get(backup_set.get('name', 'unnamed'))
+            if widgets is None:
+                if self._card_pool:
+                    self._reuse_backup_card(backup_set)
+                else:
+                    self._create_backup_card(backup_set)
+            else:
+                self._update_backup_card(widgets, backup_set)
+        
+        # Re-pack only when the configured order differs from the displayed one
+        if list(self.backup_widgets) != new_names:
+            for name in new_names:
+                self.backup_widgets[name]['card'].pack_forget()
+            for name in new_names:
+                self.backup_widgets[name]['card'].pack(fill=tk.X, padx=5, pady=8)
+                self.backup_widgets[name] = self.backup_widgets.pop(name)
+
+    def _show_empty_state(self):
+        """Show the placeholder shown when no backup sets exist."""
+        if self._empty_frame is not None:
+            return
+        
+        self._empty_frame = ttk.Frame(self.backup_items_frame)
+        self._empty_frame.pack(fill=tk.X, pady=40)
+        
+        ttk.Label(
+            self._empty_frame,
+            text=f"{ICONS.folder} No backup sets configured",
+            font=get_font(11),
+            foreground=COLORS['muted']
+        ).pack()
+        
+        ttk.Label(
+            self._empty_frame,
+            text="Go to Configuration tab to add backup sets",
+            foreground=COLORS['muted']
+        ).pack(pady=(5, 0))
+
+    def _hide_empty_state(self):
+        """Remove the empty placeholder, if shown."""
+        if self._empty_frame is not None:
+            self._empty_frame.destroy()
+            self._empty_frame = None
+
+    def _update_backup_card(self, widgets: Dict, backup_set: Dict):
+        """Update an existing card's paths in place."""
+        local = backup_set.get('local', '')
+        remote = backup_set.get('remote', '')
+        
+        if local != widgets['local']:
+            widgets['local'] = local
+            widgets['source'].config(text=local)
+        if remote != widgets['remote']:
+            widgets['remote'] = remote
+            widgets['dest'].config(text=remote)
+
+    def _reuse_backup_card(self, backup_set: Dict):
+        """Show a pooled card for a backup set, rebinding all of its labels."""
+        widgets = self._card_pool.pop()
+        name = backup_set.get('name', 'unnamed')
+        local = backup_set.get('local', '')
+        remote = backup_set.get('remote', '')
+        last_run = self.manager.get_last_run_time(name)
+        icon, color = _STATUS_STYLE['idle']
+        
+        widgets['card'].config(text=f"{ICONS.folder} {name}")
+        widgets['source'].config(text=local)
+        widgets['dest'].config(text=remote)
+        widgets['last_run'].config(
+            text=last_run,
+            foreground=COLORS['muted'] if last_run == 'Never' else COLORS['info']
+        )
+        widgets['progress'].configure(value=0)
+        widgets['status'].config(text=f"{icon} Idle", foreground=color)
+        widgets.update(
+            local=local,
+            remote=remote,
+            last_run_text=last_run,
+            last_status=None,
+            last_percent=0
+        )
+        
+        widgets['card'].pack(fill=tk.X, padx=5, pady=8)
+        self.backup_widgets[name] = widgets
 
     def _create_backup_card(self, backup_set: Dict):
         """Create a card for a backup set."""
@@ -208,7 +350,7 @@ class BackupTab:
         # Card frame
         card = ttk.Labelframe(
             self.backup_items_frame,
-            text=f"{ICONS['folder']} {name}",
+            text=f"{ICONS.folder} {name}",
             padding=15
         )
         card.pack(fill=tk.X, padx=5, pady=8)
@@ -220,7 +362,7 @@ class BackupTab:
         # Source row
         ttk.Label(
             info_frame,
-            text=f"{ICONS['folder']} Source:",
+            text=f"{ICONS.folder} Source:",
             font=get_font(9, 'bold')
         ).grid(row=0, column=0, sticky=tk.W, padx=(0, SPACING['md']))
         
@@ -230,7 +372,7 @@ class BackupTab:
         # Destination row
         ttk.Label(
             info_frame,
-            text=f"{ICONS['cloud']} Destination:",
+            text=f"{ICONS.cloud} Destination:",
             font=get_font(9, 'bold')
         ).grid(row=1, column=0, sticky=tk.W, padx=(0, SPACING['md']), pady=(SPACING['sm'], 0))
         
@@ -240,7 +382,7 @@ class BackupTab:
         # Last run row
         ttk.Label(
             info_frame,
-            text=f"{ICONS['clock']} Last Run:",
+            text=f"{ICONS.clock} Last Run:",
             font=get_font(9, 'bold')
         ).grid(row=2, column=0, sticky=tk.W, padx=(0, SPACING['md']), pady=(SPACING['sm'], 0))
         
@@ -274,7 +416,7 @@ class BackupTab:
         # Status label
         status_label = ttk.Label(
             card,
-            text=f"{ICONS['info']} Idle",
+            text=f"{ICONS.info} Idle",
             foreground=COLORS['muted']
         )
         status_label.pack(fill=tk.X, pady=(5, 0))
@@ -284,66 +426,77 @@ class BackupTab:
             'progress': progress,
             'status': status_label,
             'last_run': last_run_label,
+            'last_run_text': last_run,
+            'last_status': None,
+            'last_percent': 0,
+            'source': source_label,
+            'dest': dest_label,
+            'local': local,
+            'remote': remote,
             'card': card
         }
 
     def _start_status_updates(self):
         """Start periodic status updates."""
-        self._update_status()
+        self.scheduler.register(self._update_status, STATUS_INTERVAL_IDLE_MS)
 
-    def _update_status(self):
-        """Update status of all backup operations."""
+    def _update_status(self) -> int:
+        """Update status of all backup operations.
+        
+        Returns:
+            Delay in milliseconds before the next update
+        """
         status = self.manager.get_status()
         
         for name, widgets in self.backup_widgets.items():
             s = status.get(name)
             
-            if s:
-                percent = s.get('percent', 0)
-                line = s.get('line', '')
-                rc = s.get('rc')
-                
-                widgets['progress']['value'] = percent
+            # Skip widget reconfiguration when nothing changed since last tick
+            snapshot = (s.get('percent', 0), s.get('line', ''), s.get('rc')) if s else None
+            if snapshot != widgets['last_status']:
+                widgets['last_status'] = snapshot
                 
-                if rc is not None:
-                    if rc == 0:
-                        widgets['status'].config(
-                            text=f"{ICONS['success']} {line}",
-                            foreground=COLORS['success']
-                        )
+                if s:
+                    percent, line, rc = snapshot
+                    
+                    if percent != widgets['last_percent']:
+                        widgets['last_percent'] = percent
+                        widgets['progress'].configure(value=percent)
+                    
+                    if rc is None:
+                        state = 'running'
                     else:
-                        widgets['status'].config(
-                            text=f"{ICONS['error']} {line}",
-                            foreground=COLORS['danger']
-                        )
+                        state = 'success' if rc == 0 else 'error'
                 else:
-                    widgets['status'].config(
-                        text=f"{ICONS['loading']} {line}",
-                        foreground=COLORS['primary']
-                    )
-            else:
-                widgets['status'].config(
-                    text=f"{ICONS['info']} Idle",
-                    foreground=COLORS['muted']
-                )
+                    state, line = 'idle', 'Idle'
+                
+                icon, color = _STATUS_STYLE[state]
+                widgets['status'].config(text=f"{icon} {line}", foreground=color)
             
-            # Update last run time
+            # Update last run time, skipping the reconfigure when unchanged
             last_run = self.manager.get_last_run_time(name)
-            widgets['last_run'].config(
-                text=last_run,
-                foreground=COLORS['muted'] if last_run == 'Never' else COLORS['info']
-            )
+            if last_run != widgets['last_run_text']:
+                widgets['last_run_text'] = last_run
+                widgets['last_run'].config(
+                    text=last_run,
+                    foreground=COLORS['muted'] if last_run == 'Never' else COLORS['info']
+                )
         
         # Update main status bar
+        running = self.manager.is_running()
         if self.status_bar:
-            if self.manager.is_running():
-                running = self.manager.get_running_count()
-                self.status_bar.config(text=f"{ICONS['loading']} {running} backup(s) in progress...")
+            if running:
+                count = self.manager.get_running_count()
+                self.status_bar.config(text=f"{ICONS.loading} {count} backup(s) in progress...")
             else:
-                self.status_bar.config(text=f"{ICONS['success']} Ready")
+                self.status_bar.config(text=f"{ICONS.success} Ready")
         
-        # Schedule next update
-        self.root.after(1000, self._update_status)
+        # Poll quickly while backups run, slowly when idle
+        return STATUS_INTERVAL_RUNNING_MS if running else STATUS_INTERVAL_IDLE_MS
+
+    def _refresh_status_now(self):
+        """Run a status update immediately instead of waiting for the idle tick."""
+        self.scheduler.run_now(self._update_status)
 
     def _start_all(self):
         """Start all backups."""
@@ -355,10 +508,11 @@ class BackupTab:
         dry_run = app_settings.get('dry_run', False)
         
         self.manager.start_all(dry_run=dry_run)
+        self._refresh_status_now()
         self._update_stats()
         
         if self.status_bar:
-            self.status_bar.config(text=f"{ICONS['play']} Backups started...")
+            self.status_bar.config(text=f"{ICONS.play} Backups started...")
 
     def _run_once(self):
         """Run backups once with completion notification."""
@@ -370,22 +524,20 @@ class BackupTab:
         dry_run = app_settings.get('dry_run', False)
         
         self.manager.start_all(dry_run=dry_run)
+        self._refresh_status_now()
         
         def monitor():
-            names = [s.get('name') for s in self.manager.get_backup_sets()]
-            while True:
-                st = self.manager.get_status()
-                if all((st.get(n) and st.get(n).get('rc') is not None) for n in names):
-                    break
-                time.sleep(0.5)
+            self.manager.wait_until_done()
+            if self._closed:
+                return
             
             # Show summary
-            st = self.manager.get_status()
+            st = self.manager.get_status_snapshot()
             ok = [n for n, v in st.items() if v.get('rc') == 0]
             fail = [n for n, v in st.items() if v.get('rc') not in (0, None)]
             
-            icon = ICONS['success'] if not fail else ICONS['warning']
-            msg = f"Backup completed!\n\n{ICONS['success']} Successful: {len(ok)}\n{ICONS['error']} Failed: {len(fail)}"
+            icon = ICONS.success if not fail else ICONS.warning
+            msg = f"Backup completed!\n\n{ICONS.success} Successful: {len(ok)}\n{ICONS.error} Failed: {len(fail)}"
             
             if fail:
                 msg += f"\n\nFailed backups:\n" + "\n".join(f"  - {n}" for n in fail)
@@ -393,7 +545,7 @@ class BackupTab:
             self.root.after(0, lambda: messagebox.showinfo("Backup Complete", msg))
             self.root.after(0, self._update_stats)
         
-        threading.Thread(target=monitor, daemon=True).start()
+        self._executor.submit(monitor)
 
     def _minimize_app(self):
         """Minimize to system tray."""
@@ -419,6 +571,7 @@ class BackupTab:
             if not self.manager.is_running():
                 logger.info("Auto-run: Starting backup")
                 self.manager.start_all(dry_run=False)
+                self._refresh_status_now()
             
             # Schedule next
             self.auto_run_timer = self.root.after(
@@ -432,3 +585,10 @@ class BackupTab:
         """Reload the backup list."""
         self._refresh_backup_list()
         self._update_stats()
+
+    def close(self):
+        """Release background resources."""
+        # Pool workers are joined at interpreter exit, so wake any blocked monitor
+        self._closed = True
+        self.manager.release_waiters()
+        self._executor.shutdown(wait=False)
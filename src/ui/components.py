@@ -1,9 +1,11 @@
 # UI Components | Python
 """Reusable UI components and helper widgets."""
 
+import functools
 import platform
 import subprocess
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Tuple, Optional, Callable
 
 from ..utils.constants import (
@@ -11,17 +13,47 @@ from ..utils.constants import (
     CFG_FILE, LOG_FILE, HAS_TRAY, HAS_TTK_BOOTSTRAP,
     COLORS, ttk, messagebox, scrolledtext
 )
+from ..core.rclone_runner import RCLONE_PATH
 from .theme import ICONS, get_font, SPACING
 
+# Tooltip class, looked up once; older or newer ttkbootstrap builds may lack it
+_ToolTip = None
+if HAS_TTK_BOOTSTRAP:
+    try:
+        from ttkbootstrap.tooltip import ToolTip as _ToolTip
+    except ImportError:
+        pass
+
+# System info shown in the About dialog; fixed for the life of the process
+_PLATFORM_STR = f"{platform.system()} {platform.release()}"
+_PY_VER = platform.python_version()
+
 
 def create_tooltip(widget, text: str):
     """Attach a tooltip to a widget."""
-    if HAS_TTK_BOOTSTRAP:
+    if _ToolTip is not None:
         try:
-            from ttkbootstrap.tooltip import ToolTip
-            ToolTip(widget, text=text, delay=500)
+            return _ToolTip(widget, text=text, delay=500)
         except Exception:
             pass
+    return None
+
+
+def create_lazy_tooltip(widget, text: str):
+    """Attach a tooltip the first time the pointer enters a widget."""
+    if _ToolTip is None:
+        return
+    
+    def install(event):
+        if getattr(widget, '_tooltip', None) is not None:
+            return
+        widget._tooltip = create_tooltip(widget, text)
+        # The tooltip missed this Enter event, so replay it
+        enter = getattr(widget._tooltip, 'enter', None)
+        if enter is not None:
+            enter(event)
+    
+    widget.bind('<Enter>', install, add='+')
 
 
 class ModernCard(ttk.Frame):
@@ -57,7 +89,7 @@ class IconButton(ttk.Button):
     """A button with an icon prefix."""
     
     def __init__(self, parent, icon: str, text: str = "", **kwargs):
-        display_text = f"{ICONS.get(icon, '')} {text}".strip()
+        display_text = f"{getattr(ICONS, icon, '')} {text}".strip()
         super().__init__(parent, text=display_text, **kwargs)
 
 
@@ -67,7 +99,7 @@ class StatusIndicator(ttk.Frame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
-        self.icon_label = ttk.Label(self, text=ICONS['info'], font=('', 12))
+        self.icon_label = ttk.Label(self, text=ICONS.info, font=('', 12))
         self.icon_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.text_label = ttk.Label(self, text="Ready")
@@ -76,72 +108,56 @@ class StatusIndicator(ttk.Frame):
     def set_status(self, status: str, text: str):
         """Update the status display."""
         icon_map = {
-            'success': (ICONS['success'], COLORS['success']),
-            'error': (ICONS['error'], COLORS['danger']),
-            'warning': (ICONS['warning'], COLORS['warning']),
-            'running': (ICONS['loading'], COLORS['primary']),
-            'idle': (ICONS['info'], COLORS['muted']),
+            'success': (ICONS.success, COLORS['success']),
+            'error': (ICONS.error, COLORS['danger']),
+            'warning': (ICONS.warning, COLORS['warning']),
+            'running': (ICONS.loading, COLORS['primary']),
+            'idle': (ICONS.info, COLORS['muted']),
         }
         
-        icon, color = icon_map.get(status, (ICONS['info'], COLORS['text_primary']))
+        icon, color = icon_map.get(status, (ICONS.info, COLORS['text_primary']))
         self.icon_label.config(text=icon, foreground=color)
         self.text_label.config(text=text)
 
 
+# Menu bar layout: (menu, entries); an entry is (item type, label, callback key, accelerator)
+_SEPARATOR = ('separator', None, None, None)
+_MENUS = (
+    ("File", (
+        ('command', f"{ICONS.refresh} Reload Config", 'reload_config', "F5"),
+        ('command', f"{ICONS.file} View Config File", 'view_config_file', None),
+        _SEPARATOR,
+        ('command', f"{ICONS.close} Exit", 'on_close', "Ctrl+Q"),
+    )),
+    ("View", (
+        ('command', f"{ICONS.settings} Toggle Dark Mode", 'toggle_dark_mode', None),
+        ('checkbutton', "Minimize to Tray", 'toggle_tray', None),
+    )),
+    ("Help", (
+        ('command', f"{ICONS.file} Documentation", 'show_documentation', None),
+        ('command', f"{ICONS.settings} Keyboard Shortcuts", 'show_shortcuts', None),
+        _SEPARATOR,
+        ('command', f"{ICONS.info} About", 'show_about', None),
+    )),
+)
+
+
 def create_menu_bar(root, callbacks: Dict) -> tk.Menu:
     """Create the application menu bar."""
-    menubar = tk.Menu(root)
-    
-    # File menu
-    file_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="File", menu=file_menu)
-    
-    file_menu.add_command(
-        label=f"{ICONS['refresh']} Reload Config",
-        command=callbacks.get('reload_config'),
-        accelerator="F5"
-    )
-    file_menu.add_command(
-        label=f"{ICONS['file']} View Config File",
-        command=callbacks.get('view_config_file')
-    )
-    file_menu.add_separator()
-    file_menu.add_command(
-        label=f"{ICONS['close']} Exit",
-        command=callbacks.get('on_close'),
-        accelerator="Ctrl+Q"
-    )
-    
-    # View menu
-    view_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="View", menu=view_menu)
-    
-    view_menu.add_command(
-        label=f"{ICONS['settings']} Toggle Dark Mode",
-        command=callbacks.get('toggle_dark_mode')
-    )
-    view_menu.add_checkbutton(
-        label="Minimize to Tray",
-        command=callbacks.get('toggle_tray')
-    )
+    get = callbacks.get
+    # Resolve every callback before the first Tk call, so the build below is straight-line
+    menus = [
+        (title, [(item_type, label, get(key), accelerator) for item_type, label, key, accelerator in entries])
+        for title, entries in _MENUS
+    ]
     
-    # Help menu
-    help_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="Help", menu=help_menu)
-    
-    help_menu.add_command(
-        label=f"{ICONS['file']} Documentation",
-        command=callbacks.get('show_documentation')
-    )
-    help_menu.add_command(
-        label=f"{ICONS['settings']} Keyboard Shortcuts",
-        command=callbacks.get('show_shortcuts')
-    )
-    help_menu.add_separator()
-    help_menu.add_command(
-        label=f"{ICONS['info']} About",
-        command=callbacks.get('show_about')
-    )
+    menubar = tk.Menu(root)
+    for title, entries in menus:
+        menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label=title, menu=menu)
+        for item_type, label, command, accelerator in entries:
+            # tkinter drops options left as None, so separators take no options
+            menu.add(item_type, label=label, command=command, accelerator=accelerator)
     
     return menubar
 
@@ -157,7 +173,7 @@ def create_status_bar(parent, initial_text: str = "Ready") -> Tuple[ttk.Label, t
     
     status_label = ttk.Label(
         left_frame,
-        text=f"{ICONS['success']} {initial_text}",
+        text=f"{ICONS.success} {initial_text}",
         font=get_font(9)
     )
     status_label.pack(side=tk.LEFT)
@@ -168,7 +184,7 @@ def create_status_bar(parent, initial_text: str = "Ready") -> Tuple[ttk.Label, t
     
     backup_count_label = ttk.Label(
         right_frame,
-        text=f"{ICONS['folder']} 0 backup(s)",
+        text=f"{ICONS.folder} 0 backup(s)",
         font=get_font(9),
         foreground=COLORS['muted']
     )
@@ -181,20 +197,18 @@ def show_custom_dialog(parent, title: str, message: str, width: int = 600, heigh
     """Show a custom dialog with scrollable content."""
     dialog = tk.Toplevel(parent)
     dialog.title(title)
-    dialog.geometry(f"{width}x{height}")
-    dialog.transient(parent)
-    dialog.grab_set()
     
-    # Center on parent
-    dialog.update_idletasks()
+    # Center on parent; the dialog's size is given, so it needs no layout pass first
     x = parent.winfo_x() + (parent.winfo_width() - width) // 2
     y = parent.winfo_y() + (parent.winfo_height() - height) // 2
-    dialog.geometry(f"+{x}+{y}")
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+    dialog.transient(parent)
+    dialog.grab_set()
     
     frame = ttk.Frame(dialog, padding=20)
     frame.pack(fill=tk.BOTH, expand=True)
     
-    # Scrollable text
+    # Scrollable text, filled and locked before it is packed so it lays out once
     text_widget = scrolledtext.ScrolledText(
         frame,
         wrap=tk.WORD,
@@ -202,9 +216,9 @@ def show_custom_dialog(parent, title: str, message: str, width: int = 600, heigh
         padx=SPACING['md'],
         pady=SPACING['md']
     )
-    text_widget.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
     text_widget.insert('1.0', message)
     text_widget.configure(state=tk.DISABLED)
+    text_widget.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
     
     # OK button
     btn_frame = ttk.Frame(frame)
@@ -230,23 +244,41 @@ def show_custom_dialog(parent, title: str, message: str, width: int = 600, heigh
     dialog.bind('<Return>', lambda e: dialog.destroy())
 
 
-def show_about_dialog(parent):
-    """Show the about dialog."""
-    def get_rclone_version():
-        try:
-            result = subprocess.run(
-                ['rclone', 'version'],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            if result.returncode == 0:
-                return result.stdout.split('\n')[0].replace('rclone ', '')
-            return 'installed'
-        except Exception:
-            return 'not found'
+@functools.lru_cache(maxsize=1)
+def get_rclone_version() -> str:
+    """Get the installed rclone version, queried once per process."""
+    if RCLONE_PATH is None:
+        return 'not found'
     
-    about_text = f"""
+    try:
+        result = subprocess.run(
+            [RCLONE_PATH, 'version'],
+            capture_output=True,
+            text=True,
+            timeout=3
+        )
+        if result.returncode == 0:
+            return result.stdout.split('\n')[0].replace('rclone ', '')
+        return 'installed'
+    except Exception:
+        return 'not found'
+
+
+# Background rclone version lookup, so opening About never waits on a subprocess
+_rclone_version_future: Optional[Future] = None
+
+
+def prefetch_rclone_version():
+    """Start looking up the rclone version in the background, once per process."""
+    global _rclone_version_future
+    if _rclone_version_future is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rclone-version')
+        _rclone_version_future = executor.submit(get_rclone_version)
+        executor.shutdown(wait=False)
+
+
+# Help dialog texts, built once; the About text gets the rclone version filled in on open
+_ABOUT_TEMPLATE = f"""
 {APP_NAME}
 Version {VERSION}
 
@@ -257,17 +289,17 @@ No command line required.
 
 FEATURES
 {'-'*40}
-{ICONS['success']} Visual backup management
-{ICONS['clock']} Automatic scheduling
-{ICONS['sync']} Real-time progress tracking
-{ICONS['minimize']} System tray integration
-{ICONS['settings']} Easy configuration
+{ICONS.success} Visual backup management
+{ICONS.clock} Automatic scheduling
+{ICONS.sync} Real-time progress tracking
+{ICONS.minimize} System tray integration
+{ICONS.settings} Easy configuration
 
 SYSTEM INFO
 {'-'*40}
-Platform: {platform.system()} {platform.release()}
-Python: {platform.python_version()}
-rclone: {get_rclone_version()}
+Platform: {_PLATFORM_STR}
+Python: {_PY_VER}
+rclone: {{rclone}}
 
 FILES
 {'-'*40}
@@ -282,13 +314,10 @@ Issues: {GITHUB_REPO}/issues
 LICENSE
 {'-'*40}
 Source Available - Free for personal use
-"""
-    show_custom_dialog(parent, "About", about_text.strip())
+""".strip()
 
 
-def show_documentation_dialog(parent):
-    """Show documentation dialog."""
-    doc_text = f"""
+_DOC_TEXT = f"""
 RClone Backup Manager - Documentation
 
 QUICK START
@@ -301,9 +330,9 @@ QUICK START
 
 BACKUP OPERATIONS
 {'-'*50}
-{ICONS['play']} Start All      - Run all backups immediately
-{ICONS['bolt']} Run Once       - Run backups with completion notification  
-{ICONS['minimize']} Minimize       - Hide to system tray
+{ICONS.play} Start All      - Run all backups immediately
+{ICONS.bolt} Run Once       - Run backups with completion notification  
+{ICONS.minimize} Minimize       - Hide to system tray
 
 CONFIGURATION OPTIONS
 {'-'*50}
@@ -331,17 +360,14 @@ Escape      Close dialogs
 
 TIPS
 {'-'*50}
-{ICONS['info']} First backup uses checksum for accuracy
-{ICONS['info']} Logs auto-refresh every 2 seconds
-{ICONS['info']} Use "Run Once" for one-time backups with notification
-{ICONS['info']} System tray keeps app running in background
-"""
-    show_custom_dialog(parent, "Documentation", doc_text.strip(), 650, 500)
+{ICONS.info} First backup uses checksum for accuracy
+{ICONS.info} Logs auto-refresh every 2 seconds
+{ICONS.info} Use "Run Once" for one-time backups with notification
+{ICONS.info} System tray keeps app running in background
+""".strip()
 
 
-def show_shortcuts_dialog(parent):
-    """Show keyboard shortcuts dialog."""
-    shortcuts_text = f"""
+_SHORTCUTS_TEXT = f"""
 KEYBOARD SHORTCUTS
 {'='*40}
 
@@ -361,5 +387,24 @@ Tab             Next field
 Shift+Tab       Previous field
 Ctrl+Tab        Next tab
 Ctrl+Shift+Tab  Previous tab
-"""
-    show_custom_dialog(parent, "Keyboard Shortcuts", shortcuts_text.strip(), 400, 350)
+""".strip()
+
+
+def show_about_dialog(parent):
+    """Show the about dialog."""
+    prefetch_rclone_version()
+    try:
+        rclone = _rclone_version_future.result(timeout=0.1)
+    except FutureTimeoutError:
+        rclone = 'checking...'
+    show_custom_dialog(parent, "About", _ABOUT_TEMPLATE.replace('{rclone}', rclone))
+
+
+def show_documentation_dialog(parent):
+    """Show documentation dialog."""
+    show_custom_dialog(parent, "Documentation", _DOC_TEXT, 650, 500)
+
+
+def show_shortcuts_dialog(parent):
+    """Show keyboard shortcuts dialog."""
+    show_custom_dialog(parent, "Keyboard Shortcuts", _SHORTCUTS_TEXT, 400, 350)
@@ -1,16 +1,56 @@
 # Configuration Tab | Python
 """Configuration editor tab with modern UI."""
 
+import functools
+import threading
 import tkinter as tk
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Set
 
-from ..utils.constants import ttk, messagebox, filedialog, CFG_FILE, HAS_TTK_BOOTSTRAP, COLORS
+from ..utils.constants import (
+    ttk, messagebox, filedialog, CFG_FILE, HAS_TTK_BOOTSTRAP, IS_LINUX, IS_MAC, COLORS
+)
 from ..core.backup_manager import BackupManager
 from ..core.config_manager import save_config
 from ..core.rclone_runner import list_remotes
-from .components import create_tooltip
+from .components import create_lazy_tooltip
 from .theme import ICONS, get_font, SPACING
 
+# Number of backup cards kept alive and reused while scrolling
+CARD_POOL_SIZE = 12
+
+# Vertical gap between backup cards, in pixels
+CARD_SPACING = 16
+
+# How long a delete button stays armed waiting for the confirming click
+DELETE_CONFIRM_MS = 3000
+
+# Static label text, resolved once instead of on every card or rebuild
+_FOLDER_ICON = ICONS.folder
+_ADD_ICON = ICONS.add
+_DELETE_ICON = ICONS.delete
+_CONFIRM_DELETE_ICON = ICONS.warning
+_MUTED = COLORS['muted']
+_CARD_TITLE_PREFIX = f"{_FOLDER_ICON} "
+_HEADER_TITLE = f"{ICONS.settings} Configuration"
+_HEADER_FILE = f"  |  {ICONS.file} {CFG_FILE.name}"
+_ADD_BUTTON_TEXT = f"{_ADD_ICON} Add Backup"
+_SAVE_BUTTON_TEXT = f"{ICONS.save} Save Changes"
+_SETTINGS_TITLE = f"{ICONS.settings} General Settings"
+_LIST_TITLE = f"{_FOLDER_ICON} Configured Backups"
+_EMPTY_TITLE = f"{_ADD_ICON} No backups configured"
+_BROWSE_TEXT = ICONS.folder_open
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_remotes() -> tuple:
+    """List rclone remotes once per session; it spawns a subprocess."""
+    return tuple(list_remotes())
+
+
+def _row_key(backup_set: Dict) -> tuple:
+    """Get the values of a backup set that a card displays."""
+    return (backup_set.get('name', ''), backup_set.get('local', ''), backup_set.get('remote', ''))
+
 
 class ConfigTab:
     """Modern configuration editor tab."""
@@ -19,6 +59,7 @@ class ConfigTab:
         self.parent = parent
         self.manager = manager
         self.on_reload = on_reload
+        self._toplevel = parent.winfo_toplevel()
         
         # Settings variables
         self.transfers_var = tk.StringVar(value="8")
@@ -29,7 +70,34 @@ class ConfigTab:
         self.auto_run_var = tk.BooleanVar(value=False)
         self.auto_run_interval_var = tk.StringVar(value="5")
         
-        self.config_items_frame: Optional[ttk.Frame] = None
+        # Last parsed numeric settings, None while the entry is invalid
+        self._int_values: Dict[str, Optional[int]] = {}
+        self._save_btn: Optional[ttk.Button] = None
+        self._save_style = "primary"
+        for key, var, minimum in (
+            ('transfers', self.transfers_var, 1),
+            ('checkers', self.checkers_var, 1),
+            ('retries', self.retries_var, 0),
+            ('interval', self.auto_run_interval_var, 1),
+        ):
+            var.trace_add('write', lambda *_, k=key, v=var, m=minimum: self._validate_int(k, v, m))
+            self._validate_int(key, var, minimum)
+        
+        # Backup sets being edited; only the visible rows have card widgets
+        self._backup_sets_model: List[Dict] = []
+        self._pool: List[ttk.Labelframe] = []
+        self._scrollregion: Optional[tuple] = None
+        self.config_canvas: Optional[tk.Canvas] = None
+        self._scrollbar: Optional[ttk.Scrollbar] = None
+        self._empty_frame: Optional[ttk.Frame] = None
+        self._empty_window: Optional[int] = None
+        self._pending_cfg: Optional[str] = None
+        self._last_w = 0
+        self._add_dialog: Optional[tk.Toplevel] = None
+        self._add_dialog_vars: Dict[str, tk.StringVar] = {}
+        self._remote_combo: Optional[ttk.Combobox] = None
+        self._wheel_scripts: Dict[str, str] = {}
+        self._row_h: Optional[int] = None
 
     def setup(self):
         """Initialize the configuration tab UI."""
@@ -49,15 +117,15 @@ class ConfigTab:
         
         ttk.Label(
             title_frame,
-            text=f"{ICONS['settings']} Configuration",
+            text=_HEADER_TITLE,
             font=get_font(14, 'bold')
         ).pack(side=tk.LEFT)
         
         # Config file indicator
         ttk.Label(
             title_frame,
-            text=f"  |  {ICONS['file']} {CFG_FILE.name}",
-            foreground=COLORS['muted']
+            text=_HEADER_FILE,
+            foreground=_MUTED
         ).pack(side=tk.LEFT, padx=(10, 0))
         
         # Action buttons
@@ -67,32 +135,52 @@ class ConfigTab:
         if HAS_TTK_BOOTSTRAP:
             add_btn = ttk.Button(
                 btn_frame,
-                text=f"{ICONS['add']} Add Backup",
+                text=_ADD_BUTTON_TEXT,
                 command=self._add_backup_dialog,
                 bootstyle="success",
                 width=14
             )
             add_btn.pack(side=tk.LEFT, padx=5)
-            create_tooltip(add_btn, "Add a new backup configuration")
+            create_lazy_tooltip(add_btn, "Add a new backup configuration")
             
             save_btn = ttk.Button(
                 btn_frame,
-                text=f"{ICONS['save']} Save Changes",
+                text=_SAVE_BUTTON_TEXT,
                 command=self._save_config_from_form,
                 bootstyle="primary",
                 width=14
             )
             save_btn.pack(side=tk.LEFT, padx=5)
-            create_tooltip(save_btn, "Save all configuration changes")
+            create_lazy_tooltip(save_btn, "Save all configuration changes")
+            self._save_btn = save_btn
+            self._update_save_style()
         else:
             ttk.Button(btn_frame, text="Add Backup", command=self._add_backup_dialog).pack(side=tk.LEFT, padx=2)
             ttk.Button(btn_frame, text="Save Changes", command=self._save_config_from_form).pack(side=tk.LEFT, padx=2)
 
+    def _validate_int(self, key: str, var: tk.StringVar, minimum: int):
+        """Parse a numeric setting as it is edited and cache the result."""
+        try:
+            value = int(var.get())
+        except ValueError:
+            value = None
+        self._int_values[key] = value if value is not None and value >= minimum else None
+        self._update_save_style()
+
+    def _update_save_style(self):
+        """Flag the Save button while any numeric setting is invalid."""
+        if self._save_btn is None:
+            return
+        style = "warning" if None in self._int_values.values() else "primary"
+        if style != self._save_style:
+            self._save_style = style
+            self._save_btn.configure(bootstyle=style)
+
     def _create_settings_section(self):
         """Create the settings section."""
         settings_frame = ttk.Labelframe(
             self.parent,
-            text=f"{ICONS['settings']} General Settings",
+            text=_SETTINGS_TITLE,
             padding=15
         )
         settings_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
@@ -101,23 +189,16 @@ class ConfigTab:
         grid = ttk.Frame(settings_frame)
         grid.pack(fill=tk.X)
         
-        # Row 1: Performance settings
-        row = 0
-        
-        ttk.Label(grid, text="Transfers:").grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
-        transfers_entry = ttk.Entry(grid, textvariable=self.transfers_var, width=8)
-        transfers_entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
-        create_tooltip(transfers_entry, "Number of parallel file transfers")
-        
-        ttk.Label(grid, text="Checkers:").grid(row=row, column=2, sticky=tk.W, padx=(20, 5), pady=5)
-        checkers_entry = ttk.Entry(grid, textvariable=self.checkers_var, width=8)
-        checkers_entry.grid(row=row, column=3, sticky=tk.W, padx=5, pady=5)
-        create_tooltip(checkers_entry, "Number of parallel file checkers")
-        
-        ttk.Label(grid, text="Retries:").grid(row=row, column=4, sticky=tk.W, padx=(20, 5), pady=5)
-        retries_entry = ttk.Entry(grid, textvariable=self.retries_var, width=8)
-        retries_entry.grid(row=row, column=5, sticky=tk.W, padx=5, pady=5)
-        create_tooltip(retries_entry, "Number of retries on failure")
+        # Row 1: Performance settings, one label/entry pair per column pair
+        for i, (text, var, tip) in enumerate((
+            ("Transfers:", self.transfers_var, "Number of parallel file transfers"),
+            ("Checkers:", self.checkers_var, "Number of parallel file checkers"),
+            ("Retries:", self.retries_var, "Number of retries on failure"),
+        )):
+            ttk.Label(grid, text=text).grid(row=0, column=2 * i, sticky=tk.W, padx=(20, 5) if i else 5, pady=5)
+            entry = ttk.Entry(grid, textvariable=var, width=8)
+            entry.grid(row=0, column=2 * i + 1, sticky=tk.W, padx=5, pady=5)
+            create_lazy_tooltip(entry, tip)
         
         # Row 2: Toggles
         row = 1
@@ -154,51 +235,101 @@ class ConfigTab:
         interval_entry = ttk.Entry(toggle_frame, textvariable=self.auto_run_interval_var, width=5)
         interval_entry.pack(side=tk.LEFT)
         ttk.Label(toggle_frame, text="min").pack(side=tk.LEFT, padx=(5, 0))
-        create_tooltip(interval_entry, "Auto-run interval in minutes")
+        create_lazy_tooltip(interval_entry, "Auto-run interval in minutes")
 
     def _create_backup_list(self):
         """Create the backup sets list."""
         list_frame = ttk.Labelframe(
             self.parent,
-            text=f"{ICONS['folder']} Configured Backups",
+            text=_LIST_TITLE,
             padding=10
         )
         list_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
-        # Scrollable container
+        # Scrollable container; cards are canvas windows placed per row
         canvas = tk.Canvas(list_frame, highlightthickness=0)
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
-        self.config_items_frame = ttk.Frame(canvas)
+        self.config_canvas = canvas
+        self._scrollbar = scrollbar
         
-        self.config_items_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Placeholder shown when there are no backup sets
+        self._empty_frame = ttk.Frame(canvas)
         
-        canvas_window = canvas.create_window((0, 0), window=self.config_items_frame, anchor=tk.NW)
+        ttk.Label(
+            self._empty_frame,
+            text=_EMPTY_TITLE,
+            font=get_font(11),
+            foreground=_MUTED
+        ).pack(pady=(30, 0))
+        
+        ttk.Label(
+            self._empty_frame,
+            text="Click 'Add Backup' to create your first backup set",
+            foreground=_MUTED
+        ).pack(pady=(5, 30))
+        
+        self._empty_window = canvas.create_window(
+            (0, 0), window=self._empty_frame, anchor=tk.NW, state='hidden'
+        )
         
         def configure_canvas(event):
-            canvas.itemconfig(canvas_window, width=event.width)
+            if event.width != self._last_w:
+                self._last_w = event.width
+                canvas.itemconfig(self._empty_window, width=event.width)
+                for card in self._pool:
+                    canvas.itemconfig(card.window_id, width=event.width - 10)
+            self._schedule_scrollregion_update()
         canvas.bind('<Configure>', configure_canvas)
         
-        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        canvas.bind('<<ThemeChanged>>', self._on_theme_changed)
+        
+        # Mouse wheel, scrolled by plain Tcl scripts so no Python runs per tick
+        if IS_LINUX:
+            self._wheel_scripts = {
+                '<Button-4>': f'{canvas} yview scroll -1 units',
+                '<Button-5>': f'{canvas} yview scroll 1 units',
+            }
+        elif IS_MAC:
+            # macOS reports small deltas rather than multiples of 120
+            self._wheel_scripts = {'<MouseWheel>': f'{canvas} yview scroll [expr {{-%D}}] units'}
+        else:
+            # Truncate toward zero like the backup list, so small deltas scroll neither way
+            self._wheel_scripts = {'<MouseWheel>': f'{canvas} yview scroll [expr {{int(-%D / 120.0)}}] units'}
         
-        # Mouse wheel
-        def on_mousewheel(event):
-            if event.num == 4:
-                canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                canvas.yview_scroll(1, "units")
-            else:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Route the wheel to this canvas only while the pointer is over the list
+        def bind_wheel(event):
+            for sequence, script in self._wheel_scripts.items():
+                canvas.bind_all(sequence, script)
         
-        canvas.bind_all('<Button-4>', on_mousewheel)
-        canvas.bind_all('<Button-5>', on_mousewheel)
-        canvas.bind_all('<MouseWheel>', on_mousewheel)
+        list_frame.bind('<Enter>', bind_wheel)
+        list_frame.bind('<Leave>', lambda e: self._unbind_wheel())
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+    def _unbind_wheel(self):
+        """Drop the global wheel bindings."""
+        for sequence in self._wheel_scripts:
+            self.config_canvas.unbind_all(sequence)
+
+    def _schedule_scrollregion_update(self):
+        """Coalesce bursts of resize events into one scroll region update."""
+        if self._pending_cfg:
+            self.parent.after_cancel(self._pending_cfg)
+        self._pending_cfg = self.parent.after(30, self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Recompute the scroll region and visible rows after a resize."""
+        self._pending_cfg = None
+        self._update_scrollregion()
+        self._render_visible()
+
+    def _on_canvas_scroll(self, first: str, last: str):
+        """Keep the scrollbar in sync and rebind pooled cards to the visible rows."""
+        self._scrollbar.set(first, last)
+        self._render_visible()
+
     def _load_config_to_form(self):
         """Load configuration into the form."""
         config = self.manager.config
@@ -215,123 +346,197 @@ class ConfigTab:
         self.auto_run_var.set(app_settings.get('auto_run_enabled', False))
         self.auto_run_interval_var.set(str(app_settings.get('auto_run_interval_min', 5)))
         
-        # Clear and rebuild backup list
-        for widget in self.config_items_frame.winfo_children():
-            widget.destroy()
-        
-        backup_sets = config.get('backup_sets', [])
-        
-        if not backup_sets:
-            empty_frame = ttk.Frame(self.config_items_frame)
-            empty_frame.pack(fill=tk.X, pady=30)
-            
-            ttk.Label(
-                empty_frame,
-                text=f"{ICONS['add']} No backups configured",
-                font=get_font(11),
-                foreground=COLORS['muted']
-            ).pack()
-            
-            ttk.Label(
-                empty_frame,
-                text="Click 'Add Backup' to create your first backup set",
-                foreground=COLORS['muted']
-            ).pack(pady=(5, 0))
-            return
-        
-        for backup_set in backup_sets:
-            self._add_backup_item_to_form(backup_set)
+        # Always rebuilt from a copy of the config, so edits stay local until saved and a
+        # reload discards them; only rows whose values differ get rebound
+        old_keys = [_row_key(s) for s in self._backup_sets_model]
+        self._backup_sets_model = [dict(s) for s in config.get('backup_sets', [])]
+        changed = {
+            i for i, s in enumerate(self._backup_sets_model)
+            if i >= len(old_keys) or _row_key(s) != old_keys[i]
+        }
+        self._update_scrollregion()
+        self._render_visible(changed=changed)
 
-    def _add_backup_item_to_form(self, backup_set: dict):
-        """Add a backup item to the form."""
-        name = backup_set.get('name', '')
-        local = backup_set.get('local', '')
-        remote = backup_set.get('remote', '')
+    def _create_card(self) -> ttk.Labelframe:
+        """Create a pooled backup card; its fields are bound to a row on render."""
+        card = ttk.Labelframe(self.config_canvas, padding=15)
+        card.index = None
         
-        # Card frame
-        card = ttk.Labelframe(
-            self.config_items_frame,
-            text=f"{ICONS['folder']} {name or 'New Backup'}",
-            padding=15
-        )
-        card.pack(fill=tk.X, padx=5, pady=8)
+        # The card's StringVars live as long as the pool and are rebound with set(),
+        # so reloading never allocates or leaks Tcl variables
         
-        # Content layout
-        content = ttk.Frame(card)
-        content.pack(fill=tk.X, side=tk.LEFT, expand=True)
+        # Fields are gridded straight into the card to keep the widget tree flat
+        card.columnconfigure(1, weight=1)
         
         # Name field
-        row = ttk.Frame(content)
-        row.pack(fill=tk.X, pady=3)
-        
-        ttk.Label(row, text="Name:", width=10).pack(side=tk.LEFT)
-        name_var = tk.StringVar(value=name)
-        name_entry = ttk.Entry(row, textvariable=name_var, width=40)
-        name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(card, text="Name:", width=10).grid(row=0, column=0, sticky=tk.W, pady=3)
+        name_var = tk.StringVar()
+        name_entry = ttk.Entry(card, textvariable=name_var, width=40)
+        name_entry.grid(row=0, column=1, columnspan=2, sticky=tk.EW, pady=3)
         
         # Local path field
-        row = ttk.Frame(content)
-        row.pack(fill=tk.X, pady=3)
-        
-        ttk.Label(row, text="Local:", width=10).pack(side=tk.LEFT)
-        local_var = tk.StringVar(value=local)
-        local_entry = ttk.Entry(row, textvariable=local_var)
-        local_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        ttk.Label(card, text="Local:", width=10).grid(row=1, column=0, sticky=tk.W, pady=3)
+        local_var = tk.StringVar()
+        local_entry = ttk.Entry(card, textvariable=local_var)
+        local_entry.grid(row=1, column=1, sticky=tk.EW, padx=(0, 5), pady=3)
         
         if HAS_TTK_BOOTSTRAP:
             browse_btn = ttk.Button(
-                row,
-                text=f"{ICONS['folder_open']}",
+                card,
+                text=_BROWSE_TEXT,
                 command=lambda: self._browse_folder(local_var),
                 bootstyle="secondary-outline",
                 width=4
             )
         else:
             browse_btn = ttk.Button(
-                row,
+                card,
                 text="...",
                 command=lambda: self._browse_folder(local_var),
                 width=4
             )
-        browse_btn.pack(side=tk.LEFT)
-        create_tooltip(browse_btn, "Browse for folder")
+        browse_btn.grid(row=1, column=2, pady=3)
+        create_lazy_tooltip(browse_btn, "Browse for folder")
         
         # Remote path field
-        row = ttk.Frame(content)
-        row.pack(fill=tk.X, pady=3)
-        
-        ttk.Label(row, text="Remote:", width=10).pack(side=tk.LEFT)
-        remote_var = tk.StringVar(value=remote)
-        remote_entry = ttk.Entry(row, textvariable=remote_var)
-        remote_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        create_tooltip(remote_entry, "Format: remotename:path/to/folder")
+        ttk.Label(card, text="Remote:", width=10).grid(row=2, column=0, sticky=tk.W, pady=3)
+        remote_var = tk.StringVar()
+        remote_entry = ttk.Entry(card, textvariable=remote_var)
+        remote_entry.grid(row=2, column=1, columnspan=2, sticky=tk.EW, pady=3)
+        create_lazy_tooltip(remote_entry, "Format: remotename:path/to/folder")
         
         # Delete button
-        btn_frame = ttk.Frame(card)
-        btn_frame.pack(side=tk.RIGHT, padx=(15, 0))
-        
         if HAS_TTK_BOOTSTRAP:
             del_btn = ttk.Button(
-                btn_frame,
-                text=f"{ICONS['delete']}",
+                card,
+                text=_DELETE_ICON,
                 command=lambda: self._delete_backup_item(card),
                 bootstyle="danger-outline",
                 width=4
             )
         else:
             del_btn = ttk.Button(
-                btn_frame,
+                card,
                 text="X",
                 command=lambda: self._delete_backup_item(card),
                 width=4
             )
-        del_btn.pack()
-        create_tooltip(del_btn, "Delete this backup")
+        del_btn.grid(row=0, column=3, rowspan=3, padx=(15, 0))
+        create_lazy_tooltip(del_btn, "Click twice to delete this backup")
+        # Bound after the tooltip's own first-Enter install, which replaces <Leave> bindings
+        del_btn.bind('<Enter>', lambda e: self._bind_disarm_on_leave(card), add='+')
+        
+        # Write edits back to whichever model row the card currently shows
+        for field, var in (('name', name_var), ('local', local_var), ('remote', remote_var)):
+            var.trace_add('write', lambda *_, f=field, v=var: self._on_card_edit(card, f, v))
         
         # Store references
         card.name_var = name_var
         card.local_var = local_var
         card.remote_var = remote_var
+        card.del_btn = del_btn
+        card.pending_delete = None
+        card.disarm_bound = False
+        card.window_id = self.config_canvas.create_window(
+            (5, 0), window=card, anchor=tk.NW,
+            width=max(self.config_canvas.winfo_width() - 10, 1), state='hidden'
+        )
+        self._pool.append(card)
+        return card
+
+    def _on_card_edit(self, card: ttk.Labelframe, field: str, var: tk.StringVar):
+        """Copy an edited card field into the model."""
+        if card.index is not None:
+            self._backup_sets_model[card.index][field] = var.get().strip()
+
+    def _bind_card(self, card: ttk.Labelframe, index: int):
+        """Show model row ``index`` in a pooled card."""
+        backup_set = self._backup_sets_model[index]
+        name = backup_set.get('name', '')
+        
+        # Detach first so setting the vars doesn't write back into the model
+        card.index = None
+        self._disarm_delete(card)
+        card.configure(text=_CARD_TITLE_PREFIX + (name or 'New Backup'))
+        card.name_var.set(name)
+        card.local_var.set(backup_set.get('local', ''))
+        card.remote_var.set(backup_set.get('remote', ''))
+        card.index = index
+
+    def _row_height(self) -> int:
+        """Get the pixel height of one card row, measured once and cached."""
+        if self._row_h is not None:
+            return self._row_h
+        
+        if not self._pool:
+            self._create_card()
+        
+        # A card only has a requested size once Tk has laid it out
+        height = self._pool[0].winfo_reqheight()
+        if height <= 1:
+            self.parent.update_idletasks()
+            height = self._pool[0].winfo_reqheight()
+        if height <= 1:
+            return height + CARD_SPACING
+        
+        self._row_h = height + CARD_SPACING
+        return self._row_h
+
+    def _on_theme_changed(self, event=None):
+        """Re-measure rows after a theme change alters fonts or padding."""
+        self._row_h = None
+        self._update_scrollregion()
+        self._render_visible(force=True)
+
+    def _update_scrollregion(self):
+        """Size the scroll region to hold every row, not just the rendered ones."""
+        canvas = self.config_canvas
+        total = len(self._backup_sets_model)
+        height = total * self._row_height() if total else 0
+        region = (0, 0, canvas.winfo_width(), height)
+        
+        # Setting an unchanged region would still retrigger the scroll callback
+        if region != self._scrollregion:
+            self._scrollregion = region
+            canvas.configure(scrollregion=region)
+
+    def _render_visible(self, force: bool = False, changed: Optional[Set[int]] = None):
+        """Bind pooled cards to the rows inside the viewport.
+        
+        Args:
+            force: Rebind every visible card, e.g. after rows shifted
+            changed: Row indices whose values changed and must be rebound
+        """
+        canvas = self.config_canvas
+        total = len(self._backup_sets_model)
+        
+        canvas.itemconfigure(self._empty_window, state='normal' if not total else 'hidden')
+        
+        # Grow the pool lazily, never beyond what the list needs
+        while len(self._pool) < min(CARD_POOL_SIZE, total):
+            self._create_card()
+        
+        row_h = self._row_height() if total else 0
+        first = int(canvas.yview()[0] * total) if total else 0
+        first = max(0, min(first, total - len(self._pool)))
+        
+        for slot, card in enumerate(self._pool):
+            index = first + slot
+            if index >= total:
+                card.index = None
+                canvas.itemconfigure(card.window_id, state='hidden')
+                continue
+            if force or card.index != index or (changed and index in changed):
+                self._bind_card(card, index)
+                canvas.coords(card.window_id, 5, index * row_h + CARD_SPACING // 2)
+            canvas.itemconfigure(card.window_id, state='normal')
+
+    def _add_backup_item_to_form(self, backup_set: dict):
+        """Add a backup item to the form."""
+        self._backup_sets_model.append(dict(backup_set))
+        self._update_scrollregion()
+        self._render_visible(force=True)
+        self.config_canvas.yview_moveto(1.0)
 
     def _browse_folder(self, var: tk.StringVar):
         """Open folder browser dialog."""
@@ -342,28 +547,89 @@ class ConfigTab:
         if folder:
             var.set(folder)
 
-    def _delete_backup_item(self, frame: ttk.Labelframe):
-        """Delete a backup item."""
-        if messagebox.askyesno(
-            "Confirm Delete",
-            "Are you sure you want to delete this backup configuration?",
-            icon='warning'
-        ):
-            frame.destroy()
+    def _delete_backup_item(self, card: ttk.Labelframe):
+        """Delete the backup item shown in a card.
+        
+        The first click arms the delete button for a few seconds; a second
+        click while armed deletes the row.
+        """
+        if card.index is None:
+            return
+        
+        if card.pending_delete is None:
+            card.pending_delete = self.parent.after(DELETE_CONFIRM_MS, lambda: self._disarm_delete(card))
+            if HAS_TTK_BOOTSTRAP:
+                card.del_btn.configure(text=_CONFIRM_DELETE_ICON, bootstyle="danger")
+            else:
+                card.del_btn.configure(text="?")
+            return
+        
+        index = card.index
+        self._disarm_delete(card)
+        del self._backup_sets_model[index]
+        self._update_scrollregion()
+        self._render_visible(force=True)
+
+    def _bind_disarm_on_leave(self, card: ttk.Labelframe):
+        """Disarm the delete button when the pointer leaves it; bound once per card."""
+        if card.disarm_bound:
+            return
+        card.disarm_bound = True
+        card.del_btn.bind('<Leave>', lambda e: self._disarm_delete(card), add='+')
+
+    def _disarm_delete(self, card: ttk.Labelframe):
+        """Return an armed delete button to its normal state."""
+        if card.pending_delete is None:
+            return
+        self.parent.after_cancel(card.pending_delete)
+        card.pending_delete = None
+        if HAS_TTK_BOOTSTRAP:
+            card.del_btn.configure(text=_DELETE_ICON, bootstyle="danger-outline")
+        else:
+            card.del_btn.configure(text="X")
 
     def _add_backup_dialog(self):
         """Show dialog to add new backup."""
+        if self._add_dialog is None:
+            self._build_add_dialog()
+        else:
+            for var in self._add_dialog_vars.values():
+                var.set("")
+        
+        dialog = self._add_dialog
+        
+        # Remote names come from rclone; never block the dialog on it
+        if not self._remote_combo.cget('values'):
+            threading.Thread(target=self._fetch_remotes_bg, daemon=True).start()
+        
+        # Offset from the main window; size and position in one geometry call
+        x = self._toplevel.winfo_x() + 100
+        y = self._toplevel.winfo_y() + 100
+        dialog.geometry(f"550x280+{x}+{y}")
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _fetch_remotes_bg(self):
+        """Fetch rclone remotes off the UI thread."""
+        remotes = _cached_remotes()
+        self.parent.after(0, lambda: self._populate_remote_combo(remotes))
+
+    def _populate_remote_combo(self, remotes: tuple):
+        """Offer the fetched remotes in the add dialog."""
+        self._remote_combo.configure(values=remotes)
+
+    def _hide_add_dialog(self):
+        """Hide the add dialog so it can be shown again without rebuilding."""
+        self._add_dialog.grab_release()
+        self._add_dialog.withdraw()
+
+    def _build_add_dialog(self):
+        """Build the add dialog once; later calls reuse it."""
         dialog = tk.Toplevel(self.parent)
+        dialog.withdraw()
         dialog.title("Add New Backup")
-        dialog.geometry("550x280")
         dialog.transient(self.parent)
-        dialog.grab_set()
-        
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.parent.winfo_toplevel().winfo_x() + 100
-        y = self.parent.winfo_toplevel().winfo_y() + 100
-        dialog.geometry(f"+{x}+{y}")
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_add_dialog)
         
         frame = ttk.Frame(dialog, padding=25)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -371,7 +637,7 @@ class ConfigTab:
         # Title
         ttk.Label(
             frame,
-            text=f"{ICONS['add']} New Backup Configuration",
+            text=f"{_ADD_ICON} New Backup Configuration",
             font=get_font(12, 'bold')
         ).pack(anchor=tk.W, pady=(0, SPACING['xl']))
         
@@ -399,13 +665,14 @@ class ConfigTab:
         row.pack(fill=tk.X, pady=5)
         ttk.Label(row, text="Remote Path:", width=12).pack(side=tk.LEFT)
         remote_var = tk.StringVar()
-        ttk.Entry(row, textvariable=remote_var, width=45).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._remote_combo = ttk.Combobox(row, textvariable=remote_var, width=43)
+        self._remote_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Help text
         ttk.Label(
             form,
             text="Example remote: gdrive:Backups/MyFolder or onedrive:Documents",
-            foreground=COLORS['muted'],
+            foreground=_MUTED,
             font=get_font(9)
         ).pack(anchor=tk.W, pady=(SPACING['sm'], 0))
         
@@ -432,42 +699,38 @@ class ConfigTab:
                 'local': local_var.get().strip(),
                 'remote': remote_var.get().strip()
             })
-            dialog.destroy()
+            self._hide_add_dialog()
         
         if HAS_TTK_BOOTSTRAP:
-            ttk.Button(btn_frame, text="Cancel", command=dialog.destroy, bootstyle="secondary", width=12).pack(side=tk.RIGHT, padx=(10, 0))
-            ttk.Button(btn_frame, text=f"{ICONS['add']} Add", command=add_backup, bootstyle="success", width=12).pack(side=tk.RIGHT)
+            ttk.Button(btn_frame, text="Cancel", command=self._hide_add_dialog, bootstyle="secondary", width=12).pack(side=tk.RIGHT, padx=(10, 0))
+            ttk.Button(btn_frame, text=f"{_ADD_ICON} Add", command=add_backup, bootstyle="success", width=12).pack(side=tk.RIGHT)
         else:
-            ttk.Button(btn_frame, text="Cancel", command=dialog.destroy, width=12).pack(side=tk.RIGHT, padx=(10, 0))
+            ttk.Button(btn_frame, text="Cancel", command=self._hide_add_dialog, width=12).pack(side=tk.RIGHT, padx=(10, 0))
             ttk.Button(btn_frame, text="Add", command=add_backup, width=12).pack(side=tk.RIGHT)
         
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        dialog.bind('<Escape>', lambda e: self._hide_add_dialog())
         dialog.bind('<Return>', lambda e: add_backup())
+        
+        self._add_dialog = dialog
+        self._add_dialog_vars = {'name': name_var, 'local': local_var, 'remote': remote_var}
 
     def _save_config_from_form(self):
         """Save configuration from form values."""
-        try:
-            # Validate numeric inputs
-            transfers = int(self.transfers_var.get())
-            checkers = int(self.checkers_var.get())
-            retries = int(self.retries_var.get())
-            interval = int(self.auto_run_interval_var.get())
-            
-            if transfers < 1 or checkers < 1 or retries < 0 or interval < 1:
-                raise ValueError("Invalid numeric value")
-            
-        except ValueError:
+        # Numeric inputs are validated as they are typed
+        values = self._int_values
+        if None in values.values():
             messagebox.showerror(
                 "Invalid Input",
                 "Please enter valid numbers for Transfers, Checkers, Retries, and Interval."
             )
             return
+        interval = values['interval']
         
         # Build settings
         settings = {
-            'transfers': transfers,
-            'checkers': checkers,
-            'retries': retries,
+            'transfers': values['transfers'],
+            'checkers': values['checkers'],
+            'retries': values['retries'],
             'retries_sleep': '10s'
         }
         
@@ -480,20 +743,12 @@ class ConfigTab:
             'auto_run_interval_min': interval
         })
         
-        # Collect backup sets
-        backup_sets = []
-        for widget in self.config_items_frame.winfo_children():
-            if hasattr(widget, 'name_var'):
-                name = widget.name_var.get().strip()
-                local = widget.local_var.get().strip()
-                remote = widget.remote_var.get().strip()
-                
-                if name and local and remote:
-                    backup_sets.append({
-                        'name': name,
-                        'local': local,
-                        'remote': remote
-                    })
+        # Collect backup sets; card edits are already stripped into the model
+        backup_sets = [
+            {'name': s['name'], 'local': s['local'], 'remote': s['remote']}
+            for s in self._backup_sets_model
+            if s.get('name') and s.get('local') and s.get('remote')
+        ]
         
         # Build config
         config = {
@@ -508,7 +763,7 @@ class ConfigTab:
             self.on_reload()
             messagebox.showinfo(
                 "Saved",
-                f"{ICONS['success']} Configuration saved successfully!\n\n{len(backup_sets)} backup(s) configured."
+                f"{ICONS.success} Configuration saved successfully!\n\n{len(backup_sets)} backup(s) configured."
             )
         else:
             messagebox.showerror("Error", "Failed to save configuration.")
@@ -516,3 +771,11 @@ class ConfigTab:
     def reload(self):
         """Reload the configuration form."""
         self._load_config_to_form()
+
+    def close(self):
+        """Release global bindings and pending callbacks."""
+        if self.config_canvas is not None:
+            self._unbind_wheel()
+        if self._pending_cfg:
+            self.parent.after_cancel(self._pending_cfg)
+            self._pending_cfg = None
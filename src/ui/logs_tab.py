@@ -1,35 +1,111 @@
 # Logs Tab | Python
 """Logs viewer tab with modern UI."""
 
-import os
-import subprocess
+import contextlib
+import queue
+import threading
 import tkinter as tk
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ..utils.constants import (
     ttk, scrolledtext, messagebox,
-    IS_WINDOWS, LOG_FILE, HAS_TTK_BOOTSTRAP, COLORS
+    OPEN_FILE, LOG_FILE, HAS_TTK_BOOTSTRAP, COLORS
 )
 from ..core.backup_manager import BackupManager
 from .components import create_tooltip
-from .theme import ICONS, get_font, SPACING
+from .scheduler import RefreshScheduler
+from .theme import (
+    ICONS, get_font, SPACING,
+    LOG_TITLE, LOG_OUTPUT_TITLE, OPEN_LOG_LABEL, NO_BACKUPS_MESSAGE
+)
+
+# Most log lines kept in the viewer; older lines stay in the backup's log
+LOG_VIEW_MAX_LINES = 5000
+
+# Most log text fetched for a full load; appends after it only carry new lines
+LOG_TAIL_BYTES = 256 * 1024
+
+# Log polling intervals: fastest while output flows, slowest when idle, and while hidden
+REFRESH_FAST_MS = 500
+REFRESH_MAX_MS = 10000
+REFRESH_HIDDEN_MS = 5000
+
+# How often finished background log reads are checked for
+READ_POLL_MS = 50
+
+# Log entries highlighted per idle step after a full load
+TAG_CHUNK_LINES = 500
+
+# Log lines paired with the highlight tag the manager assigned when they were logged
+TaggedLines = List[Tuple[Optional[str], str]]
+
+
+@contextlib.contextmanager
+def _editable(text: tk.Text):
+    """Make a read-only Text widget writable for the duration of the block."""
+    text.config(state=tk.NORMAL)
+    try:
+        yield text
+    finally:
+        text.config(state=tk.DISABLED)
+
+
+def _make_bootstrap_button(parent, label: str, text: str, command: Callable, tooltip: str,
+                           bootstyle: str = "secondary-outline", width: int = 4) -> ttk.Button:
+    """Create a styled header button showing ``label``, with a tooltip."""
+    button = ttk.Button(parent, text=label, command=command, bootstyle=bootstyle, width=width)
+    button.pack(side=tk.LEFT, padx=2)
+    create_tooltip(button, tooltip)
+    return button
+
+
+def _make_plain_button(parent, label: str, text: str, command: Callable, tooltip: str,
+                       bootstyle: str = "", width: int = 4) -> ttk.Button:
+    """Create a plain ttk header button showing ``text``."""
+    button = ttk.Button(parent, text=text, command=command, width=max(8, len(text) + 2))
+    button.pack(side=tk.LEFT, padx=2)
+    return button
+
+
+# Picked once for the available toolkit
+_make_button = _make_bootstrap_button if HAS_TTK_BOOTSTRAP else _make_plain_button
 
 
 class LogsTab:
     """Modern logs viewer tab."""
 
-    def __init__(self, parent: ttk.Frame, manager: BackupManager, root: tk.Tk):
+    def __init__(self, parent: ttk.Frame, manager: BackupManager, root: tk.Tk,
+                 scheduler: Optional[RefreshScheduler] = None):
         self.parent = parent
         self.manager = manager
         self.root = root
+        self.scheduler = scheduler or RefreshScheduler(root)
         self.log_selector: Optional[ttk.Combobox] = None
         self.log_viewer: Optional[scrolledtext.ScrolledText] = None
         self.auto_scroll_var = tk.BooleanVar(value=True)
+        self._names: Tuple[str, ...] = ()
+        self._last_stamps: Dict[str, Tuple[int, int]] = {}
+        self._idle_ticks = 0
+        
+        # Kept up to date by the owner's tab-changed handler
+        self.is_visible = True
+        self._shown_key: Optional[Tuple[int, int]] = None
+        
+        # Log lines are read on a worker thread and applied from the Tk thread
+        self._read_requests: queue.Queue = queue.Queue()
+        self._read_results: queue.Queue = queue.Queue()
+        self._pending_reads = 0
+        self._drain_scheduled = False
+        
+        # Highlighting still owed to a freshly loaded log: (logs, next entry, line, column)
+        self._tag_job: Optional[str] = None
+        self._tag_state: Optional[Tuple[TaggedLines, int, int, int]] = None
 
     def setup(self):
         """Initialize the logs tab UI."""
         self._create_header()
         self._create_log_viewer()
+        threading.Thread(target=self._read_worker, name='log-reader', daemon=True).start()
         self._refresh_log_selector()
         self._start_auto_refresh()
 
@@ -41,7 +117,7 @@ class LogsTab:
         # Title
         ttk.Label(
             header,
-            text=f"{ICONS['file']} Backup Logs",
+            text=LOG_TITLE,
             font=get_font(14, 'bold')
         ).pack(side=tk.LEFT)
         
@@ -58,49 +134,21 @@ class LogsTab:
         create_tooltip(self.log_selector, "Select a backup to view its logs")
         
         # Action buttons
+        _make_button(controls, ICONS.refresh, "Refresh", self._refresh_log_selector, "Refresh backup list")
+        _make_button(controls, ICONS.delete, "Clear", self._clear_log_view, "Clear log view")
         if HAS_TTK_BOOTSTRAP:
-            refresh_btn = ttk.Button(
-                controls,
-                text=f"{ICONS['refresh']}",
-                command=self._refresh_log_selector,
-                bootstyle="secondary-outline",
-                width=4
-            )
-            refresh_btn.pack(side=tk.LEFT, padx=2)
-            create_tooltip(refresh_btn, "Refresh backup list")
-            
-            clear_btn = ttk.Button(
-                controls,
-                text=f"{ICONS['delete']}",
-                command=self._clear_log_view,
-                bootstyle="secondary-outline",
-                width=4
-            )
-            clear_btn.pack(side=tk.LEFT, padx=2)
-            create_tooltip(clear_btn, "Clear log view")
-            
             ttk.Separator(controls, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=10)
-            
-            open_btn = ttk.Button(
-                controls,
-                text=f"{ICONS['external']} Open Log File",
-                command=self._view_log_file,
-                bootstyle="info-outline",
-                width=14
-            )
-            open_btn.pack(side=tk.LEFT, padx=2)
-            create_tooltip(open_btn, "Open main application log file")
-        else:
-            ttk.Button(controls, text="Refresh", command=self._refresh_log_selector, width=8).pack(side=tk.LEFT, padx=2)
-            ttk.Button(controls, text="Clear", command=self._clear_log_view, width=8).pack(side=tk.LEFT, padx=2)
-            ttk.Button(controls, text="Open Log", command=self._view_log_file, width=10).pack(side=tk.LEFT, padx=2)
+        _make_button(
+            controls, OPEN_LOG_LABEL, "Open Log", self._view_log_file,
+            "Open main application log file", bootstyle="info-outline", width=14
+        )
 
     def _create_log_viewer(self):
         """Create the log viewer widget."""
         # Container frame
         viewer_frame = ttk.Labelframe(
             self.parent,
-            text=f"{ICONS['file']} Log Output",
+            text=LOG_OUTPUT_TITLE,
             padding=10
         )
         viewer_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
@@ -146,8 +194,10 @@ class LogsTab:
 
     def _refresh_log_selector(self):
         """Refresh the backup selector dropdown."""
-        names = [s.get('name') for s in self.manager.get_backup_sets()]
-        self.log_selector['values'] = names
+        names = self.manager.get_backup_set_names()
+        if names != self._names:
+            self._names = names
+            self.log_selector['values'] = names
         
         if names:
             if not self.log_selector.get() or self.log_selector.get() not in names:
@@ -159,13 +209,11 @@ class LogsTab:
 
     def _show_no_backups_message(self):
         """Show message when no backups are configured."""
-        self.log_viewer.config(state=tk.NORMAL)
-        self.log_viewer.delete('1.0', tk.END)
-        self.log_viewer.insert('1.0', 
-            f"\n\n    {ICONS['info']} No backup sets configured.\n\n"
-            f"    Go to Configuration tab to add backup sets.\n"
-        )
-        self.log_viewer.config(state=tk.DISABLED)
+        self._shown_key = None
+        self._cancel_deferred_tags()
+        with _editable(self.log_viewer):
+            self.log_viewer.delete('1.0', tk.END)
+            self.log_viewer.insert('1.0', NO_BACKUPS_MESSAGE)
 
     def _load_selected_log(self, event):
         """Load logs for the selected backup."""
@@ -173,45 +221,175 @@ class LogsTab:
         if not name:
             return
         
-        logs = self.manager.get_logs(name)
+        stamp = self.manager.get_log_stamp(name)
+        self._last_stamps[name] = stamp
+        self._request_read('load', name, max(0, stamp[1] - LOG_VIEW_MAX_LINES), stamp[1])
+
+    def _show_loaded_log(self, name: str, logs: TaggedLines):
+        """Show freshly loaded logs, or a placeholder when there are none."""
+        self._shown_key = (len(logs), hash(tuple(logs))) if logs else None
+        self._cancel_deferred_tags()
+        with _editable(self.log_viewer):
+            self.log_viewer.delete('1.0', tk.END)
+            if logs:
+                # Paint plain text in one call; highlighting follows from the idle loop
+                self.log_viewer.insert(tk.END, ''.join(line for _, line in logs))
+                self._tag_state = (logs, 0, 1, 0)
+                self._tag_job = self.root.after_idle(self._apply_tags_async)
+            else:
+                self.log_viewer.insert('1.0',
+                    f"\n    {ICONS.info} No logs available for '{name}' yet.\n\n"
+                    f"    Logs will appear here when the backup runs.\n"
+                )
         
-        self.log_viewer.config(state=tk.NORMAL)
-        self.log_viewer.delete('1.0', tk.END)
+        if self.auto_scroll_var.get():
+            self.log_viewer.see(tk.END)
+
+    def _request_read(self, kind: str, name: str, start: int, end: int):
+        """Ask the reader thread for log lines; the result is applied by _drain_reads.
         
-        if logs:
-            self._insert_highlighted_logs(logs)
-        else:
-            self.log_viewer.insert('1.0',
-                f"\n    {ICONS['info']} No logs available for '{name}' yet.\n\n"
-                f"    Logs will appear here when the backup runs.\n"
-            )
+        Args:
+            kind: 'load', 'replace' or 'append', selecting how the result is shown
+            name: Backup set name
+            start: Index of the first log line to read
+            end: Index after the last log line to read
+        """
+        self._read_requests.put((kind, name, start, end))
+        self._pending_reads += 1
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.root.after(READ_POLL_MS, self._drain_reads)
+
+    def _read_worker(self):
+        """Serve log read requests off the Tk thread until told to stop."""
+        while True:
+            request = self._read_requests.get()
+            if request is None:
+                return
+            kind, name, start, end = request
+            try:
+                tail_bytes = None if kind == 'append' else LOG_TAIL_BYTES
+                logs = self.manager.get_logs_tagged(name, start, end, tail_bytes)
+            except Exception:
+                logs = []
+            self._read_results.put((kind, name, logs))
+
+    def _drain_reads(self):
+        """Apply finished log reads to the viewer."""
+        self._drain_scheduled = False
+        results = []
+        while True:
+            try:
+                results.append(self._read_results.get_nowait())
+            except queue.Empty:
+                break
+        self._pending_reads -= len(results)
         
-        self.log_viewer.config(state=tk.DISABLED)
+        # Reads for another backup are stale, and a full load supersedes earlier reads
+        current = self.log_selector.get()
+        results = [r for r in results if r[1] == current]
+        for i in range(len(results) - 1, -1, -1):
+            if results[i][0] != 'append':
+                results = results[i:]
+                break
         
-        if self.auto_scroll_var.get():
-            self.log_viewer.see(tk.END)
+        for kind, name, logs in results:
+            if kind == 'load':
+                self._show_loaded_log(name, logs)
+            elif kind == 'replace':
+                self._replace_logs(logs)
+            else:
+                self._append_logs(logs)
+        
+        if self._pending_reads > 0:
+            self._drain_scheduled = True
+            self.root.after(READ_POLL_MS, self._drain_reads)
 
-    def _insert_highlighted_logs(self, logs: str):
+    def _insert_highlighted_logs(self, logs: TaggedLines):
         """Insert logs with syntax highlighting."""
-        for line in logs.split('\n'):
-            if '===' in line or line.startswith('Backup:') or line.startswith('Source:'):
-                self.log_viewer.insert(tk.END, line + '\n', 'header')
-            elif 'SUCCESS' in line or 'Completed' in line or 'exit code: 0' in line:
-                self.log_viewer.insert(tk.END, line + '\n', 'success')
-            elif 'ERROR' in line or 'FAILED' in line or 'error' in line.lower():
-                self.log_viewer.insert(tk.END, line + '\n', 'error')
-            elif 'WARNING' in line or 'warning' in line.lower():
-                self.log_viewer.insert(tk.END, line + '\n', 'warning')
-            elif line.startswith('$') or 'Transferring' in line:
-                self.log_viewer.insert(tk.END, line + '\n', 'info')
+        # Group consecutive lines sharing a tag, then insert every run in one Tcl call
+        chunks = []
+        run = []
+        run_tag = None
+        for tag, line in logs:
+            if tag != run_tag and run:
+                chunks += (''.join(run), run_tag or ())
+                run = []
+            run_tag = tag
+            run.append(line)
+        if run:
+            chunks += (''.join(run), run_tag or ())
+        
+        if chunks:
+            self.log_viewer.insert(tk.END, *chunks)
+
+    def _apply_tags_async(self):
+        """Highlight the next chunk of a freshly loaded log, then yield to the event loop."""
+        self._tag_job = None
+        if self._tag_state is None:
+            return
+        self._tag_lines(TAG_CHUNK_LINES)
+        if self._tag_state is not None:
+            self._tag_job = self.root.after(0, self._apply_tags_async)
+
+    def _tag_lines(self, count: Optional[int] = None):
+        """Tag up to ``count`` pending log entries, or all of them when None."""
+        logs, i, line, col = self._tag_state
+        end = len(logs) if count is None else min(len(logs), i + count)
+        
+        # Collect the ranges of each tag, then add them with one call per tag
+        ranges: Dict[str, List[str]] = {}
+        for tag, text in logs[i:end]:
+            start = f'{line}.{col}'
+            newlines = text.count('\n')
+            if newlines:
+                line += newlines
+                col = len(text) - text.rindex('\n') - 1
             else:
-                self.log_viewer.insert(tk.END, line + '\n')
+                col += len(text)
+            if tag:
+                ranges.setdefault(tag, []).extend((start, f'{line}.{col}'))
+        for tag, indices in ranges.items():
+            self.log_viewer.tag_add(tag, *indices)
+        
+        self._tag_state = (logs, end, line, col) if end < len(logs) else None
+
+    def _finish_deferred_tags(self):
+        """Apply any highlighting still pending, before the viewer's lines move."""
+        if self._tag_state is not None:
+            self._tag_lines()
+        self._cancel_deferred_tags()
+
+    def _cancel_deferred_tags(self):
+        """Drop pending highlighting for content that is about to be replaced."""
+        if self._tag_job is not None:
+            self.root.after_cancel(self._tag_job)
+            self._tag_job = None
+        self._tag_state = None
+
+    def _append_logs(self, logs: TaggedLines):
+        """Append new log lines to the end of the viewer."""
+        self._shown_key = None
+        self._finish_deferred_tags()
+        with _editable(self.log_viewer):
+            self._insert_highlighted_logs(logs)
+            self._trim_log_view()
+        
+        if self.auto_scroll_var.get():
+            self.log_viewer.see(tk.END)
+
+    def _trim_log_view(self):
+        """Drop the oldest lines so the viewer never holds more than LOG_VIEW_MAX_LINES."""
+        excess = int(self.log_viewer.index('end-1c').split('.')[0]) - LOG_VIEW_MAX_LINES
+        if excess > 0:
+            self.log_viewer.delete('1.0', f'{excess + 1}.0')
 
     def _clear_log_view(self):
         """Clear the log viewer."""
-        self.log_viewer.config(state=tk.NORMAL)
-        self.log_viewer.delete('1.0', tk.END)
-        self.log_viewer.config(state=tk.DISABLED)
+        self._shown_key = None
+        self._cancel_deferred_tags()
+        with _editable(self.log_viewer):
+            self.log_viewer.delete('1.0', tk.END)
 
     def _view_log_file(self):
         """Open the main application log file."""
@@ -223,45 +401,87 @@ class LogsTab:
             return
         
         try:
-            if IS_WINDOWS:
-                os.startfile(LOG_FILE)
-            else:
-                subprocess.Popen(['xdg-open', str(LOG_FILE)])
+            OPEN_FILE(LOG_FILE)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open log file:\n{e}")
 
     def _start_auto_refresh(self):
         """Start automatic log refresh."""
-        self._auto_refresh()
+        self.scheduler.register(self._auto_refresh, REFRESH_FAST_MS)
 
-    def _auto_refresh(self):
-        """Auto-refresh the log view."""
+    def _auto_refresh(self) -> int:
+        """Auto-refresh the log view, polling faster while logs are changing.
+        
+        Returns:
+            Delay in milliseconds before the next refresh
+        """
+        if not self._is_visible():
+            return REFRESH_HIDDEN_MS
+        
+        changed = False
         try:
-            current_log = self.log_selector.get()
-            if current_log:
-                logs = self.manager.get_logs(current_log)
-                if logs:
-                    # Check if content changed
-                    self.log_viewer.config(state=tk.NORMAL)
-                    current_content = self.log_viewer.get('1.0', tk.END).strip()
-                    
-                    if logs.strip() != current_content:
-                        scroll_pos = self.log_viewer.yview()
-                        self.log_viewer.delete('1.0', tk.END)
-                        self._insert_highlighted_logs(logs)
-                        
-                        if self.auto_scroll_var.get():
-                            self.log_viewer.see(tk.END)
-                        else:
-                            self.log_viewer.yview_moveto(scroll_pos[0])
-                    
-                    self.log_viewer.config(state=tk.DISABLED)
+            changed = self._refresh_current_log()
         except Exception:
             pass
         
-        # Schedule next refresh
-        self.root.after(2000, self._auto_refresh)
+        # Back off exponentially while nothing changes
+        self._idle_ticks = 0 if changed else min(self._idle_ticks + 1, 5)
+        return min(REFRESH_MAX_MS, REFRESH_FAST_MS * 2 ** self._idle_ticks)
+
+    def _is_visible(self) -> bool:
+        """Check whether the logs tab is on screen."""
+        return self.is_visible and self.root.state() not in ('withdrawn', 'iconic')
+
+    def _refresh_current_log(self) -> bool:
+        """Bring the viewer up to date with the selected backup's logs.
+        
+        Returns:
+            True if the selected backup had new log output
+        """
+        current_log = self.log_selector.get()
+        stamp = self.manager.get_log_stamp(current_log) if current_log else None
+        
+        # Only fetch and compare logs when the backup has written something new
+        if stamp is None or stamp == self._last_stamps.get(current_log):
+            return False
+        
+        last = self._last_stamps.get(current_log)
+        self._last_stamps[current_log] = stamp
+        
+        if last is not None and last[0] == stamp[0] and 0 < last[1] < stamp[1]:
+            # Same run, more lines: append just the new ones
+            self._request_read('append', current_log, last[1], stamp[1])
+        else:
+            self._request_read('replace', current_log, max(0, stamp[1] - LOG_VIEW_MAX_LINES), stamp[1])
+        return True
+
+    def _replace_logs(self, logs: TaggedLines):
+        """Replace the viewer contents if the logs differ from what is shown."""
+        if not logs:
+            return
+        
+        # Compare against what was last shown instead of reading the widget back
+        key = (len(logs), hash(tuple(logs)))
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+        self._cancel_deferred_tags()
+        
+        scroll_pos = self.log_viewer.yview()
+        with _editable(self.log_viewer):
+            self.log_viewer.delete('1.0', tk.END)
+            self._insert_highlighted_logs(logs)
+        
+        if self.auto_scroll_var.get():
+            self.log_viewer.see(tk.END)
+        else:
+            self.log_viewer.yview_moveto(scroll_pos[0])
 
     def reload(self):
         """Reload the logs tab."""
         self._refresh_log_selector()
+
+    def close(self):
+        """Stop the log reader thread and any pending highlighting."""
+        self._cancel_deferred_tags()
+        self._read_requests.put(None)
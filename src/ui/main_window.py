@@ -1,14 +1,12 @@
 # Main Window | Python
 """Main application window with tabbed interface."""
 
-import os
-import subprocess
 import sys
 import tkinter as tk
 from typing import Optional
 
 from ..utils.constants import (
-    APP_NAME, VERSION, HAS_TRAY, IS_WINDOWS,
+    APP_NAME, VERSION, HAS_TRAY, OPEN_FILE,
     CFG_FILE, HAS_TTK_BOOTSTRAP, DEFAULT_THEME, DARK_THEME,
     ttk, messagebox, logger
 )
@@ -17,16 +15,17 @@ from ..core.config_manager import save_config
 from ..utils.tray_manager import TrayManager
 from .components import (
     create_menu_bar, create_status_bar,
-    show_about_dialog, show_documentation_dialog, show_shortcuts_dialog
+    show_about_dialog, show_documentation_dialog, show_shortcuts_dialog,
+    prefetch_rclone_version
 )
 from .backup_tab import BackupTab
 from .config_tab import ConfigTab
 from .logs_tab import LogsTab
-from .theme import ThemeManager, ICONS
-
-if HAS_TRAY:
-    from PIL import Image, ImageDraw, ImageTk
-
+from .scheduler import RefreshScheduler
+from .theme import (
+    ThemeManager, ICONS,
+    TAB_BACKUP_LABEL, TAB_CONFIG_LABEL, TAB_LOGS_LABEL, CONFIG_RELOADED_MESSAGE
+)
 
 class MainWindow:
     """Main application window."""
@@ -58,7 +57,12 @@ class MainWindow:
             value=app_settings.get('minimize_to_tray', True)
         )
         
+        # One timer drives the periodic refreshes of every tab
+        self.scheduler = RefreshScheduler(self.root)
+        
         # UI components
+        self._tab_initialized = {}
+        self._tab_keys = {}
         self.backup_tab: Optional[BackupTab] = None
         self.config_tab: Optional[ConfigTab] = None
         self.logs_tab: Optional[LogsTab] = None
@@ -68,6 +72,7 @@ class MainWindow:
         
         self._setup_ui()
         self._setup_tray()
+        prefetch_rclone_version()
         
         # Check start minimized
         if app_settings.get('start_minimized', False) and HAS_TRAY:
@@ -84,6 +89,8 @@ class MainWindow:
         """Set the window icon."""
         try:
             if HAS_TRAY:
+                from PIL import Image, ImageDraw, ImageTk
+                
                 size = 32
                 img = Image.new('RGBA', (size, size), color=(0, 0, 0, 0))
                 draw = ImageDraw.Draw(img)
@@ -132,27 +139,41 @@ class MainWindow:
         """Setup all tabs."""
         # Backup Tab
         backup_frame = ttk.Frame(self.notebook)
-        self.notebook.add(backup_frame, text=f" {ICONS['sync']} Backups ")
+        self.notebook.add(backup_frame, text=TAB_BACKUP_LABEL)
         self.backup_tab = BackupTab(
             backup_frame,
             self.manager,
             self.root,
-            on_minimize=lambda: self._minimize_to_tray(force=True)
+            on_minimize=lambda: self._minimize_to_tray(force=True),
+            scheduler=self.scheduler
         )
         self.backup_tab.status_bar = self.status_bar
         self.backup_tab.setup()
         
         # Configuration Tab
         config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(config_frame, text=f" {ICONS['settings']} Configuration ")
+        self.notebook.add(config_frame, text=TAB_CONFIG_LABEL)
         self.config_tab = ConfigTab(config_frame, self.manager, self._reload_all_tabs)
-        self.config_tab.setup()
         
         # Logs Tab
         logs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(logs_frame, text=f" {ICONS['file']} Logs ")
-        self.logs_tab = LogsTab(logs_frame, self.manager, self.root)
-        self.logs_tab.setup()
+        self.notebook.add(logs_frame, text=TAB_LOGS_LABEL)
+        self.logs_tab = LogsTab(logs_frame, self.manager, self.root, self.scheduler)
+        
+        # Config and logs contents are built the first time their tab is selected
+        self._tab_initialized = {'backup': True, 'config': False, 'logs': False}
+        self._tab_keys = {str(config_frame): 'config', str(logs_frame): 'logs'}
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Set up a lazily built tab the first time it is shown."""
+        key = self._tab_keys.get(self.notebook.select())
+        if key and not self._tab_initialized[key]:
+            self._tab_initialized[key] = True
+            getattr(self, f'{key}_tab').setup()
+        
+        # Log polling does no work while the tab is hidden
+        self.logs_tab.is_visible = key == 'logs'
 
     def _setup_tray(self):
         """Setup system tray icon."""
@@ -166,26 +187,25 @@ class MainWindow:
             on_start=self._start_backups_from_tray,
             on_quit=self._quit_app
         )
-        self.tray_manager.create_icon()
 
     def _update_backup_count(self):
         """Update the backup count in status bar."""
-        count = len(self.manager.get_backup_sets())
-        self.backup_count_label.config(text=f"{ICONS['folder']} {count} backup(s)")
+        count = len(self.manager.get_backup_set_names())
+        self.backup_count_label.config(text=f"{ICONS.folder} {count} backup(s)")
 
     def _reload_config(self):
         """Reload configuration from file."""
         self.manager.reload_config()
         self._reload_all_tabs()
-        messagebox.showinfo("Reloaded", f"{ICONS['success']} Configuration reloaded successfully.")
+        messagebox.showinfo("Reloaded", CONFIG_RELOADED_MESSAGE)
 
     def _reload_all_tabs(self):
         """Reload all tabs after configuration changes."""
         if self.backup_tab:
             self.backup_tab.reload()
-        if self.config_tab:
+        if self.config_tab and self._tab_initialized.get('config'):
             self.config_tab.reload()
-        if self.logs_tab:
+        if self.logs_tab and self._tab_initialized.get('logs'):
             self.logs_tab.reload()
         
         self._update_backup_count()
@@ -197,10 +217,7 @@ class MainWindow:
             return
         
         try:
-            if IS_WINDOWS:
-                os.startfile(CFG_FILE)
-            else:
-                subprocess.Popen(['xdg-open', str(CFG_FILE)])
+            OPEN_FILE(CFG_FILE)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open config file:\n{e}")
 
@@ -229,21 +246,19 @@ class MainWindow:
         if not force and not self.minimize_to_tray_enabled.get():
             return
         
-        if HAS_TRAY and self.tray_manager:
+        if HAS_TRAY and self.tray_manager and self.tray_manager.run():
             logger.info("Minimizing to system tray")
             self.root.withdraw()
             self.is_minimized_to_tray = True
-            self.tray_manager.run()
         else:
             # Fallback: just iconify
             self.root.iconify()
 
     def _start_minimized(self):
         """Start application minimized to tray."""
-        if HAS_TRAY and self.tray_manager:
+        if HAS_TRAY and self.tray_manager and self.tray_manager.run():
             self.root.withdraw()
             self.is_minimized_to_tray = True
-            self.tray_manager.run()
 
     def _restore_from_tray(self, icon=None, item=None):
         """Restore window from tray."""
@@ -273,6 +288,14 @@ class MainWindow:
         if self.tray_manager:
             self.tray_manager.stop()
         
+        if self.backup_tab:
+            self.backup_tab.close()
+        if self.config_tab:
+            self.config_tab.close()
+        if self.logs_tab:
+            self.logs_tab.close()
+        self.scheduler.stop()
+        
         try:
             self.root.quit()
             self.root.destroy()
@@ -0,0 +1,79 @@
+# Refresh Scheduler | Python
+"""Shared timer that drives periodic UI refresh callbacks."""
+
+import heapq
+import itertools
+import time
+import tkinter as tk
+from typing import Callable, List, Optional, Tuple
+
+from ..utils.constants import logger
+
+# Coarsest granularity of the shared timer, in milliseconds
+TICK_MS = 500
+
+
+class RefreshScheduler:
+    """Run periodic refresh callbacks from one Tk timer instead of one per tab.
+
+    A callback may return a number of milliseconds to override the delay
+    before its next run, e.g. to back off while idle; returning None keeps
+    its registered interval.
+    """
+
+    def __init__(self, root: tk.Tk, tick_ms: int = TICK_MS):
+        self.root = root
+        self.tick_ms = tick_ms
+        self._heap: List[Tuple[float, int, int, Callable]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[str] = None
+
+    def register(self, callback: Callable[[], Optional[int]], interval_ms: int):
+        """Run ``callback`` on the next tick and then every ``interval_ms``."""
+        heapq.heappush(self._heap, (time.monotonic(), next(self._seq), interval_ms, callback))
+        self._schedule()
+
+    def run_now(self, callback: Callable[[], Optional[int]]):
+        """Run a registered callback immediately and restart its interval from now."""
+        for i, entry in enumerate(self._heap):
+            if entry[3] == callback:
+                self._heap[i] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                self._run(entry[2], callback, time.monotonic())
+                self._schedule()
+                return
+
+    def stop(self):
+        """Cancel the shared timer."""
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        self._heap.clear()
+
+    def _schedule(self):
+        """Wake up when the earliest callback is due, but no more often than a tick."""
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        delay = (self._heap[0][0] - time.monotonic()) * 1000 if self._heap else 0
+        self._timer = self.root.after(max(self.tick_ms, int(delay)), self._tick)
+
+    def _tick(self):
+        """Run every due callback and reschedule it."""
+        self._timer = None
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, interval_ms, callback = heapq.heappop(self._heap)
+            self._run(interval_ms, callback, now)
+        if self._heap:
+            self._schedule()
+
+    def _run(self, interval_ms: int, callback: Callable[[], Optional[int]], now: float):
+        """Run one callback and queue its next run."""
+        try:
+            next_ms = callback()
+        except Exception as e:
+            logger.error(f"Refresh callback failed: {e}")
+            next_ms = None
+        delay = interval_ms if next_ms is None else next_ms
+        heapq.heappush(self._heap, (now + delay / 1000, next(self._seq), interval_ms, callback))
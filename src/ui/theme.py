@@ -1,10 +1,10 @@
 # Theme Manager and Icons | Python
 """Modern theme management and SVG-style icon definitions."""
 
-import platform
+from types import SimpleNamespace
 from typing import Dict, Tuple
 
-from ..utils.constants import HAS_TTK_BOOTSTRAP, COLORS
+from ..utils.constants import HAS_TTK_BOOTSTRAP, COLORS, SYSTEM
 
 
 # Cross-platform font configuration
@@ -27,6 +27,10 @@ FONTS = {
     }
 }
 
+# Font families for this platform, resolved once
+_PRIMARY_FONT = FONTS.get(SYSTEM, FONTS['fallback'])['primary']
+_MONO_FONT = FONTS.get(SYSTEM, FONTS['fallback'])['mono']
+
 # Consistent spacing throughout the app
 SPACING = {
     'xs': 2,
@@ -49,17 +53,15 @@ def get_font(size: int = 10, weight: str = '', mono: bool = False) -> Tuple[str,
     Returns:
         Font tuple suitable for tkinter widget config
     """
-    system = platform.system()
-    fonts = FONTS.get(system, FONTS['fallback'])
-    font_name = fonts['mono'] if mono else fonts['primary']
+    font_name = _MONO_FONT if mono else _PRIMARY_FONT
     
     if weight:
         return (font_name, size, weight)
     return (font_name, size)
 
 
-# Unicode icons for cross-platform compatibility
-ICONS = {
+# Unicode icons for cross-platform compatibility, read as attributes (ICONS.folder)
+ICONS = SimpleNamespace(**{
     # Navigation
     'home': '\u2302',
     'settings': '\u2699',
@@ -111,7 +113,20 @@ ICONS = {
     'minimize': '\u2193',
     'maximize': '\u2197',
     'close': '\u2715',
-}
+})
+
+# Static labels, built once at import
+TAB_BACKUP_LABEL = f" {ICONS.sync} Backups "
+TAB_CONFIG_LABEL = f" {ICONS.settings} Configuration "
+TAB_LOGS_LABEL = f" {ICONS.file} Logs "
+LOG_TITLE = f"{ICONS.file} Backup Logs"
+LOG_OUTPUT_TITLE = f"{ICONS.file} Log Output"
+OPEN_LOG_LABEL = f"{ICONS.external} Open Log File"
+NO_BACKUPS_MESSAGE = (
+    f"\n\n    {ICONS.info} No backup sets configured.\n\n"
+    f"    Go to Configuration tab to add backup sets.\n"
+)
+CONFIG_RELOADED_MESSAGE = f"{ICONS.success} Configuration reloaded successfully."
 
 
 class ThemeManager:
@@ -3,8 +3,8 @@
 
 from .constants import (
     VERSION, APP_NAME, GITHUB_REPO, AUTHOR,
-    HAS_TK, HAS_TTK_BOOTSTRAP, HAS_TRAY,
-    IS_WINDOWS, IS_LINUX,
+    HAS_TK, HAS_TTK_BOOTSTRAP, HAS_TRAY, HAS_ORJSON,
+    IS_WINDOWS, IS_LINUX, SYSTEM, OPEN_FILE,
     DEFAULT_THEME, DARK_THEME, COLORS,
     HERE, CFG_FILE, LOG_FILE, STATE_FILE, FIRST_RUN_FLAG,
     logger, ttk, messagebox, scrolledtext, filedialog
@@ -13,8 +13,8 @@ from .tray_manager import TrayManager
 
 __all__ = [
     'VERSION', 'APP_NAME', 'GITHUB_REPO', 'AUTHOR',
-    'HAS_TK', 'HAS_TTK_BOOTSTRAP', 'HAS_TRAY',
-    'IS_WINDOWS', 'IS_LINUX',
+    'HAS_TK', 'HAS_TTK_BOOTSTRAP', 'HAS_TRAY', 'HAS_ORJSON',
+    'IS_WINDOWS', 'IS_LINUX', 'SYSTEM', 'OPEN_FILE',
     'DEFAULT_THEME', 'DARK_THEME', 'COLORS',
     'HERE', 'CFG_FILE', 'LOG_FILE', 'STATE_FILE', 'FIRST_RUN_FLAG',
     'logger', 'ttk', 'messagebox', 'scrolledtext', 'filedialog',
@@ -1,9 +1,15 @@
 # Global Constants and Configuration | Python
 """Global constants, logging setup, and framework imports."""
 
+import atexit
+import importlib.util
 import logging
+import os
 import platform
+import queue
+import subprocess
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Metadata
@@ -30,18 +36,26 @@ except ImportError:
         print("ERROR: tkinter not available. Please install python3-tk")
         sys.exit(1)
 
-# System Tray Support
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    HAS_TRAY = True
-except ImportError:
-    HAS_TRAY = False
+# System Tray Support (only looked up here; imported when the tray is first used)
+HAS_TRAY = all(importlib.util.find_spec(name) is not None for name in ('pystray', 'PIL'))
+
+# Fast JSON Support (only looked up here; imported by the state manager)
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None
 
 # Platform Detection
-IS_WINDOWS = platform.system() == 'Windows'
-IS_LINUX = platform.system() == 'Linux'
-IS_MAC = platform.system() == 'Darwin'
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == 'Windows'
+IS_LINUX = SYSTEM == 'Linux'
+IS_MAC = SYSTEM == 'Darwin'
+
+
+def _xdg_open(path):
+    """Open a file with the desktop's default application."""
+    subprocess.Popen(['xdg-open', str(path)])
+
+
+# Opens a file in its default application, resolved once for this platform
+OPEN_FILE = os.startfile if IS_WINDOWS else _xdg_open
 
 # Theme Settings
 DEFAULT_THEME = "cosmo"
@@ -83,12 +97,19 @@ STATE_FILE = DATA_DIR / 'state.json'
 DATA_DIR.mkdir(exist_ok=True)
 
 # Logging Configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+# Callers only enqueue records; a listener thread formats and writes them
+_log_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+_log_handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
@@ -2,13 +2,33 @@
 """System tray icon management for background operation."""
 
 import threading
-from typing import Callable, Optional
+from functools import lru_cache
+from importlib import resources
+from typing import TYPE_CHECKING, Callable, Optional
 
-from .constants import HAS_TRAY, APP_NAME
+from .constants import HAS_TRAY, APP_NAME, logger
 
-if HAS_TRAY:
+if TYPE_CHECKING:
     import pystray
-    from PIL import Image, ImageDraw
+    from PIL import Image
+
+
+# pystray backends whose run_detached() leaves running a GLib main loop to the caller
+_GLIB_BACKENDS = ('pystray._gtk', 'pystray._appindicator')
+
+# Pre-rendered 64x64 RGBA tray icon, bundled as package data
+TRAY_ICON_FILE = resources.files(__package__) / 'assets' / 'tray_icon.png'
+
+
+@lru_cache(maxsize=None)
+def _tray_icon_image() -> 'Image.Image':
+    """Load the tray icon once; every TrayManager reuses the same image."""
+    from PIL import Image
+    
+    with TRAY_ICON_FILE.open('rb') as f:
+        img = Image.open(f)
+        img.load()
+    return img
 
 
 class TrayManager:
@@ -28,33 +48,20 @@ class TrayManager:
 
     def _create_icon_image(self) -> 'Image.Image':
         """Create a modern tray icon."""
-        size = 64
-        img = Image.new('RGBA', (size, size), color=(0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Background circle with gradient effect
-        draw.ellipse((2, 2, size-2, size-2), fill=(13, 110, 253))
-        draw.ellipse((4, 4, size-4, size-4), fill=(30, 125, 255))
-        
-        # Inner circle for depth
-        inner_margin = 12
-        draw.ellipse(
-            (inner_margin, inner_margin, size-inner_margin, size-inner_margin),
-            fill=(255, 255, 255, 40)
-        )
-        
-        # Draw sync arrows icon
-        arrow_color = (255, 255, 255)
-        # Simplified arrow representation
-        draw.polygon([(20, 32), (32, 20), (32, 28), (44, 28), (44, 36), (32, 36), (32, 44)], fill=arrow_color)
-        
-        return img
+        return _tray_icon_image()
 
     def create_icon(self) -> Optional['pystray.Icon']:
-        """Create and configure the system tray icon."""
+        """Create and configure the system tray icon; run() calls this on first use."""
         if not HAS_TRAY:
             return None
 
+        # Deferred until the tray is first needed, as pystray loads a desktop backend
+        try:
+            import pystray
+        except Exception as e:
+            logger.warning(f"System tray unavailable: {e}")
+            return None
+
         img = self._create_icon_image()
 
         menu = pystray.Menu(
@@ -72,15 +79,23 @@ class TrayManager:
         )
         return self.icon
 
-    def run(self):
-        """Start the tray icon in a background thread."""
-        if not HAS_TRAY or not self.icon:
-            return
+    def run(self) -> bool:
+        """Start the tray icon without blocking the Tk main loop.
+        
+        Returns:
+            True if the tray icon is running
+        """
+        if not HAS_TRAY or not (self.icon or self.create_icon()):
+            return False
 
         if not self._running:
             self._running = True
-            thread = threading.Thread(target=self.icon.run, daemon=True)
-            thread.start()
+            if type(self.icon).__module__ in _GLIB_BACKENDS:
+                # Tk runs no GLib loop, so icon.run() has to provide one on its own thread
+                threading.Thread(target=self.icon.run, daemon=True).start()
+            else:
+                self.icon.run_detached()
+        return True
 
     def stop(self):
         """Stop and remove the tray icon."""
@@ -0,0 +1,92 @@
+# Backup Manager Tests | Python
+"""Tests for BackupManager log access."""
+
+import os
+import unittest
+from unittest import mock
+
+from src.core import backup_manager
+from src.core.backup_manager import BackupManager, _resolve_remote
+
+
+def _make_manager() -> BackupManager:
+    """Create a manager without touching the config or state files."""
+    with mock.patch.object(backup_manager, 'load_config', return_value={'backup_sets': []}), \
+            mock.patch.object(backup_manager, 'StateManager'):
+        return BackupManager()
+
+
+class GetLogsTest(unittest.TestCase):
+    """get_logs / get_logs_tagged slicing by line range and tail size."""
+
+    def setUp(self):
+        self.manager = _make_manager()
+        self.manager.logs['docs'] = ['one\n', 'two\n', 'three\n', 'four\n']
+        self.manager.log_tags['docs'] = ['header', None, 'error', None]
+
+    def test_full_log(self):
+        self.assertEqual(self.manager.get_logs('docs'), 'one\ntwo\nthree\nfour\n')
+
+    def test_unknown_backup(self):
+        self.assertEqual(self.manager.get_logs('missing'), '')
+        self.assertEqual(self.manager.get_logs_tagged('missing'), [])
+
+    def test_start_and_end(self):
+        self.assertEqual(self.manager.get_logs('docs', 1, 3), 'two\nthree\n')
+        self.assertEqual(self.manager.get_logs('docs', 2), 'three\nfour\n')
+        self.assertEqual(self.manager.get_logs('docs', 4), '')
+
+    def test_tags_follow_lines(self):
+        self.assertEqual(
+            self.manager.get_logs_tagged('docs', 1, 3),
+            [(None, 'two\n'), ('error', 'three\n')]
+        )
+
+    def test_tail_keeps_whole_trailing_lines(self):
+        # 'four\n' and 'three\n' fit in 11 characters; 'two\n' would not
+        self.assertEqual(self.manager.get_logs('docs', tail_bytes=11), 'three\nfour\n')
+        self.assertEqual(self.manager.get_logs('docs', tail_bytes=1000), 'one\ntwo\nthree\nfour\n')
+
+    def test_tail_always_keeps_last_line(self):
+        self.assertEqual(self.manager.get_logs('docs', tail_bytes=0), 'four\n')
+        self.assertEqual(self.manager.get_logs_tagged('docs', 0, 3, tail_bytes=1), [('error', 'three\n')])
+
+    def test_tail_of_empty_range(self):
+        self.assertEqual(self.manager.get_logs_tagged('docs', 4, tail_bytes=10), [])
+
+    def test_slices_are_copies(self):
+        self.manager.get_logs_tagged('docs', tail_bytes=5)
+        self.assertEqual(len(self.manager.logs['docs']), 4)
+        self.assertEqual(len(self.manager.log_tags['docs']), 4)
+
+    def test_log_stamp(self):
+        self.assertEqual(self.manager.get_log_stamp('docs'), (0, 4))
+        self.assertEqual(self.manager.get_log_stamp('missing'), (0, 0))
+
+
+class ResolveRemoteTest(unittest.TestCase):
+    """Single-folder remote paths get the source folder's name appended."""
+
+    local = os.path.join(os.sep, 'home', 'me', 'Documents')
+
+    def test_single_folder_gets_source_name(self):
+        self.assertEqual(_resolve_remote(self.local, 'gdrive:Backups'), 'gdrive:Backups/Documents')
+
+    def test_trailing_separator_on_source(self):
+        self.assertEqual(_resolve_remote(self.local + os.sep, 'gdrive:Backups'), 'gdrive:Backups/Documents')
+
+    def test_nested_path_is_unchanged(self):
+        self.assertEqual(_resolve_remote(self.local, 'gdrive:Backups/Docs'), 'gdrive:Backups/Docs')
+
+    def test_remote_root_is_unchanged(self):
+        self.assertEqual(_resolve_remote(self.local, 'gdrive:'), 'gdrive:')
+
+    def test_local_destination_is_unchanged(self):
+        self.assertEqual(_resolve_remote(self.local, 'Backups'), 'Backups')
+
+    def test_only_first_colon_splits(self):
+        self.assertEqual(_resolve_remote(self.local, 's3:bucket:odd'), 's3:bucket:odd/Documents')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# Log Classifier Tests | Python
+"""Tests for backup log line classification."""
+
+import unittest
+
+from src.core.log_classifier import classify_log_line
+
+
+class ClassifyLogLineTest(unittest.TestCase):
+    """classify_log_line picks the first matching highlight tag."""
+
+    def test_headers(self):
+        self.assertEqual(classify_log_line('=' * 60 + '\n'), 'header')
+        self.assertEqual(classify_log_line('Backup: docs\n'), 'header')
+        self.assertEqual(classify_log_line('Source: /home/me\n'), 'header')
+
+    def test_success(self):
+        self.assertEqual(classify_log_line('[SUCCESS] Exit code: 0\n'), 'success')
+        self.assertEqual(classify_log_line('Completed successfully\n'), 'success')
+
+    def test_error_is_case_insensitive(self):
+        self.assertEqual(classify_log_line('[FAILED] Exit code: 1\n'), 'error')
+        self.assertEqual(classify_log_line('2024/01/01 ERROR : file: failed\n'), 'error')
+        self.assertEqual(classify_log_line('an error occurred\n'), 'error')
+
+    def test_warning_and_info(self):
+        self.assertEqual(classify_log_line('Warning: slow remote\n'), 'warning')
+        self.assertEqual(classify_log_line('$ rclone copy a b\n'), 'info')
+        self.assertEqual(classify_log_line('Transferring: file.txt\n'), 'info')
+
+    def test_plain_line(self):
+        self.assertIsNone(classify_log_line('Checks: 10 / 10, 100%\n'))
+        self.assertIsNone(classify_log_line('\n'))
+
+    def test_priority_order(self):
+        # Header wins over success, success over error
+        self.assertEqual(classify_log_line('=== SUCCESS ===\n'), 'header')
+        self.assertEqual(classify_log_line('Completed with error count 0\n'), 'success')
+        self.assertEqual(classify_log_line('error: warning limit\n'), 'error')
+
+    def test_results_are_cached(self):
+        classify_log_line.cache_clear()
+        classify_log_line('Transferring: a\n')
+        classify_log_line('Transferring: a\n')
+        info = classify_log_line.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
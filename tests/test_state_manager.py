@@ -0,0 +1,155 @@
+# State Manager Tests | Python
+"""Tests for persistent backup state."""
+
+import json
+import mmap
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core import state_manager
+from src.core.state_manager import StateManager, HISTORY_LIMIT
+
+
+class StateManagerTestCase(unittest.TestCase):
+    """Points the state file at a temporary directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_file = Path(tmp.name) / 'state.json'
+        patcher = mock.patch.object(state_manager, 'STATE_FILE', self.state_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_manager(self) -> StateManager:
+        manager = StateManager()
+        # Write anything still pending before the temporary directory goes away
+        self.addCleanup(manager._flush)
+        return manager
+
+    def read_state_file(self) -> dict:
+        return json.loads(self.state_file.read_bytes())
+
+
+class DebouncedFlushTest(StateManagerTestCase):
+    """Runs are written once, after FLUSH_DELAY of quiet."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(state_manager, 'FLUSH_DELAY', 0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_are_written_after_the_delay(self):
+        manager = self.make_manager()
+        with mock.patch.object(manager, 'save', wraps=manager.save) as save:
+            manager.record_run('docs', True, 1.5)
+            manager.record_run('photos', False, 2.0)
+            self.assertFalse(self.state_file.exists())
+            
+            deadline = time.monotonic() + 2
+            while not self.state_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+        
+        self.assertEqual(save.call_count, 1)
+        state = self.read_state_file()
+        self.assertEqual(set(state['last_runs']), {'docs', 'photos'})
+        self.assertEqual(state['statistics']['total_runs'], 2)
+
+    def test_flush_writes_pending_changes_immediately(self):
+        manager = self.make_manager()
+        manager.record_run('docs', True, 1.0)
+        manager._flush()
+        
+        self.assertTrue(self.state_file.exists())
+        self.assertIsNone(manager._flush_timer)
+        self.assertFalse(manager._dirty)
+
+    def test_flush_without_changes_does_not_write(self):
+        manager = self.make_manager()
+        manager._flush()
+        self.assertFalse(self.state_file.exists())
+
+
+class RunHistoryTest(StateManagerTestCase):
+    """Run history is a bounded deque, newest first when read back."""
+
+    def test_history_is_bounded(self):
+        manager = self.make_manager()
+        for i in range(HISTORY_LIMIT + 5):
+            manager.record_run(f'set{i}', True, 0.0)
+        
+        self.assertEqual(len(manager._state['run_history']), HISTORY_LIMIT)
+        recent = manager.get_recent_history(3)
+        self.assertEqual([r['name'] for r in recent], [f'set{HISTORY_LIMIT + 4 - i}' for i in range(3)])
+
+    def test_history_survives_a_reload(self):
+        manager = self.make_manager()
+        manager.record_run('docs', True, 1.0)
+        manager._flush()
+        
+        history = self.make_manager()._state['run_history']
+        self.assertEqual(history.maxlen, HISTORY_LIMIT)
+        self.assertEqual([r['name'] for r in history], ['docs'])
+
+    def test_last_run_time(self):
+        manager = self.make_manager()
+        self.assertEqual(manager.get_last_run_time('docs'), 'Never')
+        manager.record_run('docs', True, 1.0)
+        self.assertRegex(manager.get_last_run_time('docs'), r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+
+class LoadStateTest(StateManagerTestCase):
+    """State files load through orjson, mmap or stdlib json."""
+
+    def write_state(self, names):
+        state = {
+            'last_runs': {n: {'timestamp': '2024-01-02T03:04:05', 'success': True, 'duration': 1.0} for n in names},
+            'run_history': [{'name': n, 'timestamp': '2024-01-02T03:04:05', 'success': True, 'duration': 1.0} for n in names],
+            'statistics': {'total_runs': len(names), 'successful_runs': len(names), 'failed_runs': 0},
+        }
+        self.state_file.write_text(json.dumps(state), encoding='utf-8')
+
+    @unittest.skipUnless(state_manager.HAS_ORJSON, 'orjson not installed')
+    def test_large_file_is_memory_mapped(self):
+        self.write_state([f'set{i}' for i in range(50)])
+        with mock.patch.object(state_manager, 'MMAP_THRESHOLD', 16), \
+                mock.patch.object(state_manager.mmap, 'mmap', wraps=mmap.mmap) as mapped:
+            manager = self.make_manager()
+        
+        mapped.assert_called_once()
+        self.assertEqual(manager.get_statistics()['total_runs'], 50)
+        self.assertEqual(len(manager._state['run_history']), 50)
+
+    def test_small_file_is_read_directly(self):
+        self.write_state(['docs'])
+        with mock.patch.object(state_manager.mmap, 'mmap') as mapped:
+            manager = self.make_manager()
+        
+        mapped.assert_not_called()
+        self.assertEqual(manager.get_last_run_time('docs'), '2024-01-02 03:04:05')
+
+    def test_stdlib_json_fallback(self):
+        with mock.patch.object(state_manager, 'HAS_ORJSON', False):
+            manager = self.make_manager()
+            manager.record_run('docs', False, 3.0)
+            manager._flush()
+            reloaded = self.make_manager()
+        
+        self.assertEqual(reloaded.get_statistics()['failed_runs'], 1)
+        self.assertEqual(reloaded.get_last_run('docs')['success'], False)
+
+    def test_corrupt_file_falls_back_to_defaults(self):
+        self.state_file.write_bytes(b'{not json')
+        with self.assertLogs(state_manager.logger, 'ERROR'):
+            manager = self.make_manager()
+        self.assertEqual(manager.get_statistics()['total_runs'], 0)
+        self.assertEqual(len(manager._state['run_history']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()